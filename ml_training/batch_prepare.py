@@ -28,6 +28,19 @@ from case_parser.patterns.categorization import categorize_procedure
 console = Console()
 
 
+def _column_values(
+    df: pd.DataFrame, column: str | None, default: object = None
+) -> list[Any]:
+    """Return a column as a plain list, or ``default`` per row when it is absent.
+
+    Reading whole columns avoids building a ``pd.Series`` for every row the
+    way ``iterrows()`` does.
+    """
+    if column is None or column not in df.columns:
+        return [default] * len(df)
+    return df[column].tolist()
+
+
 def process_single_file(
     file_path: Path, sample_size: int | None = None
 ) -> dict[str, Any]:
@@ -39,15 +52,21 @@ def process_single_file(
             df = df.sample(n=sample_size, random_state=42)
 
         cases: list[dict[str, Any]] = []
-        for _, row in df.iterrows():
-            procedure = str(row.get("AIMS_Actual_Procedure_Text", ""))
+        rows = zip(
+            _column_values(df, "AIMS_Actual_Procedure_Text", ""),
+            _column_values(df, service_column, ""),
+            _column_values(df, "AIMS_Patient_Age_Years"),
+            _column_values(df, "ASA_Status"),
+            _column_values(df, "Emergency"),
+            strict=True,
+        )
+        for raw_procedure, raw_service, age, asa, emergency in rows:
+            procedure = str(raw_procedure)
             if not procedure or procedure == "nan":
                 continue
 
             service_text = (
-                ""
-                if service_column is None
-                else coerce_service_text(row.get(service_column, ""))
+                "" if service_column is None else coerce_service_text(raw_service)
             )
             category, warnings = categorize_procedure(
                 procedure,
@@ -61,9 +80,9 @@ def process_single_file(
                     category.value if category is not None else "Other (procedure cat)"
                 ),
                 "warnings": "; ".join(warnings) if warnings else "",
-                "age": row.get("AIMS_Patient_Age_Years"),
-                "asa": row.get("ASA_Status"),
-                "emergency": row.get("Emergency"),
+                "age": age,
+                "asa": asa,
+                "emergency": emergency,
             })
 
         return {
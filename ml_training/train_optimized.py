@@ -4,12 +4,12 @@
 from __future__ import annotations
 
 import argparse
-import pickle  # noqa: S403
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
 import pandas as pd
 from rich.console import Console
@@ -28,7 +28,7 @@ try:
         build_feature_inputs,
         resolve_service_column,
     )
-    from case_parser.ml.predictor import ProcedureMLPipeline
+    from case_parser.ml.predictor import ProcedureMLPipeline, write_model_checksum
     from ml_training.utils import normalize_category_label
 except ImportError:
     project_root = Path(__file__).resolve().parent.parent
@@ -40,7 +40,7 @@ except ImportError:
         build_feature_inputs,
         resolve_service_column,
     )
-    from case_parser.ml.predictor import ProcedureMLPipeline
+    from case_parser.ml.predictor import ProcedureMLPipeline, write_model_checksum
     from ml_training.utils import normalize_category_label
 
 console = Console()
@@ -377,7 +377,7 @@ def _save_model_artifact(
     artifacts: TrainArtifacts,
     metadata_input: ArtifactMetadataInput,
 ) -> None:
-    """Persist the trained pipeline and metadata to a pickle artifact."""
+    """Persist the trained pipeline and metadata with a SHA-256 sidecar."""
     pipeline = ProcedureMLPipeline(
         model=artifacts.model,
         features=artifacts.feature_extractor,
@@ -396,8 +396,8 @@ def _save_model_artifact(
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("wb") as fh:
-        pickle.dump({"pipeline": pipeline, "metadata": metadata}, fh)
+    joblib.dump({"pipeline": pipeline, "metadata": metadata}, output_path)
+    write_model_checksum(output_path)
     console.print(f"\n[green]Model saved to {output_path}[/green]")
 
 
@@ -608,8 +608,7 @@ def _load_review_cases(
     procedure_col = _resolve_procedure_column(df)
 
     procedures = df[procedure_col].fillna("").astype(str).tolist()
-    ml_predictions = predictor.pipeline.predict(procedures)
-    ml_probabilities = predictor.pipeline.predict_proba(procedures)
+    ml_predictions, ml_probabilities = predictor.pipeline.predict_with_proba(procedures)
     classes = list(predictor.pipeline.classes_)
 
     cases: list[ReviewCase] = []
@@ -655,8 +654,9 @@ def _save_review_progress(runtime: ReviewRuntime) -> None:
         "model_path": str(runtime.paths.model_path),
         "reviewed_indices": sorted(runtime.reviewed_indices),
     }
-    with progress_path.open("w", encoding="utf-8") as file_handle:
-        json.dump(payload, file_handle, indent=2)
+    # One encoded write; json.dump() on a text handle issues a small write
+    # per token, and this file is rewritten after every reviewed case.
+    progress_path.write_bytes(json.dumps(payload, indent=2).encode())
 
 
 def _load_reviewed_indices(paths: ReviewPaths, resume: bool) -> set[int]:
@@ -1,21 +1,27 @@
 """Case Parser - A tool for processing anesthesia case data from Excel files."""
 
-from .cli import main
-from .domain import (
-    AgeCategory,
-    AirwayManagement,
-    AnesthesiaType,
-    MonitoringTechnique,
-    ParsedCase,
-    ProcedureCategory,
-    VascularAccess,
-)
-from .io import ExcelHandler
-from .models import ColumnMap
-from .patterns.age_patterns import AgeRange
-from .patterns.procedure_patterns import ProcedureRule
-from .processor import CaseProcessor
-from .validation import ValidationReport
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import main
+    from .domain import (
+        AgeCategory,
+        AirwayManagement,
+        AnesthesiaType,
+        MonitoringTechnique,
+        ParsedCase,
+        ProcedureCategory,
+        VascularAccess,
+    )
+    from .io import ExcelHandler
+    from .models import ColumnMap
+    from .patterns.age_patterns import AgeRange
+    from .patterns.procedure_patterns import ProcedureRule
+    from .processor import CaseProcessor
+    from .validation import ValidationReport
 
 __version__ = "0.2.0"
 __all__ = [
@@ -34,3 +40,37 @@ __all__ = [
     "VascularAccess",
     "main",
 ]
+
+# Public names resolve on first access so importing one submodule (for example
+# case_parser.models) does not pull in pandas, rich and the ML stack.
+_EXPORT_MODULES = {  # noqa: RUF067
+    "AgeCategory": ".domain",
+    "AgeRange": ".patterns.age_patterns",
+    "AirwayManagement": ".domain",
+    "AnesthesiaType": ".domain",
+    "CaseProcessor": ".processor",
+    "ColumnMap": ".models",
+    "ExcelHandler": ".io",
+    "MonitoringTechnique": ".domain",
+    "ParsedCase": ".domain",
+    "ProcedureCategory": ".domain",
+    "ProcedureRule": ".patterns.procedure_patterns",
+    "ValidationReport": ".validation",
+    "VascularAccess": ".domain",
+    "main": ".cli",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a public name from its defining submodule on first access."""
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names in dir() output."""
+    return sorted({*globals(), *__all__})
@@ -6,7 +6,7 @@ import argparse
 import logging
 import sys
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -62,6 +62,11 @@ logger = logging.getLogger(__name__)
 console = Console()
 __all__ = ["split_standalone_cases"]
 type _ProcessingMode = Literal["excel", "csv_v2"]
+# ColumnMap fields and their --col-* flags, resolved once at import.
+_COL_FIELDS = tuple(ColumnMap.__dataclass_fields__)
+_COL_ARGS = tuple(
+    (f"--col-{field_name.replace('_', '-')}", field_name) for field_name in _COL_FIELDS
+)
 
 
 @dataclass(frozen=True)
@@ -73,6 +78,9 @@ class _ProcessingOptions:
     use_ml: bool
     ml_threshold: float
     workers: int
+    read_only: bool = True
+    nrows: int | None = None
+    skiprows: int | None = None
 
 
 @dataclass(frozen=True)
@@ -147,6 +155,27 @@ Examples:
 
     # Optional arguments
     parser.add_argument("--sheet", help="Sheet name to read (default: first sheet)")
+    parser.add_argument(
+        "--read-only",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Open .xlsx inputs in streaming read-only mode (default: on; "
+            "use --no-read-only for workbooks with incorrect sheet dimensions)"
+        ),
+    )
+    parser.add_argument(
+        "--nrows",
+        type=int,
+        help="Only parse the first N data rows of each Excel input",
+        metavar="N",
+    )
+    parser.add_argument(
+        "--skiprows",
+        type=int,
+        help="Skip N data rows after the header of each Excel input",
+        metavar="N",
+    )
     parser.add_argument(
         "--default-year",
         type=int,
@@ -210,8 +239,7 @@ Examples:
     )
 
     # Column override options
-    for field_name in ColumnMap.__dataclass_fields__:
-        arg_name = f"--col-{field_name.replace('_', '-')}"
+    for arg_name, field_name in _COL_ARGS:
         help_text = f"Override {field_name} column name"
         if field_name == "emergent":
             help_text += " (optional column)"
@@ -229,13 +257,12 @@ def columns_from_args(args: argparse.Namespace) -> ColumnMap:
     Returns:
         ColumnMap with default values overridden by any provided --col-* flags.
     """
-    base = ColumnMap()
-    kwargs = {}
-    for field_name in ColumnMap.__dataclass_fields__:
-        arg_name = f"col_{field_name}"
-        if hasattr(args, arg_name) and getattr(args, arg_name) is not None:
-            kwargs[field_name] = getattr(args, arg_name)
-    return ColumnMap(**{**base.__dict__, **kwargs})
+    overrides = {
+        field_name: value
+        for field_name in _COL_FIELDS
+        if (value := getattr(args, f"col_{field_name}", None)) is not None
+    }
+    return replace(ColumnMap(), **overrides)
 
 
 def validate_arguments(args: argparse.Namespace) -> None:
@@ -247,7 +274,7 @@ def validate_arguments(args: argparse.Namespace) -> None:
     Raises:
         FileNotFoundError: If the input path does not exist.
         ValueError: If the input/output formats are unsupported, no Excel files
-            are found in a directory, or the year is out of range.
+            are found in a directory, or a numeric option is out of range.
     """
     if not args.input_file or not args.output_file:
         raise ValueError("Both input_file and output_file are required for processing.")
@@ -278,12 +305,21 @@ def validate_arguments(args: argparse.Namespace) -> None:
     if output_path.suffix.lower() != ".xlsx":
         raise ValueError("Output file must have .xlsx extension")
 
+    _validate_numeric_arguments(args)
+
+
+def _validate_numeric_arguments(args: argparse.Namespace) -> None:
+    """Raise ValueError when a numeric CLI option is out of range."""
     if args.default_year < 1900 or args.default_year > 2100:
         raise ValueError("Default year must be between 1900 and 2100")
     if not 0.0 <= args.ml_threshold <= 1.0:
         raise ValueError("ML threshold must be between 0.0 and 1.0")
     if args.workers < 1:
         raise ValueError("workers must be at least 1")
+    if args.nrows is not None and args.nrows < 0:
+        raise ValueError("nrows must be at least 0")
+    if args.skiprows is not None and args.skiprows < 0:
+        raise ValueError("skiprows must be at least 0")
 
 
 def find_excel_files(directory: Path) -> list[Path]:
@@ -313,7 +349,13 @@ def _load_excel_input(input_path: Path, options: _ProcessingOptions) -> _LoadedI
     loaded_file_count = 0
     for excel_file in excel_files:
         console.print(f"[cyan]Reading:[/cyan] {excel_file.name}")
-        df = read_excel(str(excel_file), sheet_name=options.sheet_name or 0)
+        df = read_excel(
+            str(excel_file),
+            sheet_name=options.sheet_name or 0,
+            read_only=options.read_only,
+            nrows=options.nrows,
+            skiprows=options.skiprows,
+        )
         if df.empty:
             console.print(
                 f"[yellow]  Warning:[/yellow] {excel_file.name} is empty, skipping"
@@ -899,6 +941,9 @@ def main() -> None:
             use_ml=not args.no_ml,
             ml_threshold=args.ml_threshold,
             workers=args.workers,
+            read_only=args.read_only,
+            nrows=args.nrows,
+            skiprows=args.skiprows,
         )
 
         processing_result = process_input(
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Overall confidence below this marks a case as low confidence.
+LOW_CONFIDENCE_THRESHOLD = 0.7
 
+
+@lru_cache(maxsize=32768)
 def _strip_phi(text: str) -> str:
     """Remove [PHI] markers and normalize whitespace."""
     return " ".join(text.replace("[PHI]", "").split())
 
 
+# Output columns repeat a few hundred dates and technique combinations across
+# thousands of cases, so each distinct value is formatted once.
+@lru_cache(maxsize=4096)
+def _format_case_date(case_date: date) -> str:
+    """Format a case date as MM/DD/YYYY for output."""
+    return case_date.strftime("%m/%d/%Y")
+
+
+@lru_cache(maxsize=4096)
+def _join_values(values: tuple[StrEnum, ...]) -> str:
+    """Join enum values with "; " for multi-value output columns."""
+    return "; ".join(value.value for value in values)
+
+
 class AgeCategory(StrEnum):
     """Age category classifications for residency requirements."""
 
@@ -89,15 +109,25 @@ class MonitoringTechnique(StrEnum):
     INVASIVE_NEURO_MON = "Invasive neuro mon"
 
 
-class ExtractionFinding(BaseModel):
-    """A single extraction finding with metadata."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExtractionFinding:
+    """A single extraction finding with metadata.
 
-    value: str = Field(description="The extracted value")
-    confidence: float = Field(
-        default=1.0, ge=0.0, le=1.0, description="Confidence score 0-1"
-    )
-    context: str | None = Field(default=None, description="Surrounding text context")
-    source_field: str = Field(description="Which field this was extracted from")
+    Extractors emit several of these per note, so this is a slotted dataclass
+    rather than a model; ``ParsedCase`` still validates and serializes it.
+    """
+
+    value: str  # The extracted value
+    source_field: str  # Which field this was extracted from
+    confidence: float = 1.0  # Confidence score 0-1
+    context: str | None = None  # Surrounding text context
+
+    def __post_init__(self) -> None:
+        """Reject confidence scores outside 0-1."""
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(
+                f"confidence must be between 0 and 1, got {self.confidence}"
+            )
 
 
 class ParsedCase(BaseModel):
@@ -189,7 +219,7 @@ class ParsedCase(BaseModel):
             return v
         if isinstance(v, str):
             # Split on newlines and filter empty strings
-            return [s.strip() for s in v.split("\n") if s.strip()]
+            return [s for s in (part.strip() for part in v.split("\n")) if s]
         return []
 
     def to_output_dict(self) -> dict[str, str]:
@@ -205,7 +235,7 @@ class ParsedCase(BaseModel):
         """
         return {
             "Case ID": self.episode_id or "",
-            "Case Date": self.case_date.strftime("%m/%d/%Y"),
+            "Case Date": _format_case_date(self.case_date),
             "Supervisor": self.responsible_provider or "",
             "Age": self.age_category.value if self.age_category else "",
             "Original Procedure": self.procedure or "",
@@ -213,20 +243,10 @@ class ParsedCase(BaseModel):
             "Anesthesia Type": self.anesthesia_type.value
             if self.anesthesia_type
             else "",
-            "Airway Management": "; ".join(am.value for am in self.airway_management)
-            if self.airway_management
-            else "",
+            "Airway Management": _join_values(tuple(self.airway_management)),
             "Procedure Category": self.procedure_category.value,
-            "Specialized Vascular Access": "; ".join(
-                va.value for va in self.vascular_access
-            )
-            if self.vascular_access
-            else "",
-            "Specialized Monitoring Techniques": "; ".join(
-                mt.value for mt in self.monitoring
-            )
-            if self.monitoring
-            else "",
+            "Specialized Vascular Access": _join_values(tuple(self.vascular_access)),
+            "Specialized Monitoring Techniques": _join_values(tuple(self.monitoring)),
         }
 
     def to_standalone_output_dict(self) -> dict[str, str]:
@@ -242,7 +262,7 @@ class ParsedCase(BaseModel):
         """
         return {
             "Case ID": self.episode_id or "",
-            "Case Date": self.case_date.strftime("%m/%d/%Y"),
+            "Case Date": _format_case_date(self.case_date),
             "Supervisor": _strip_phi(self.responsible_provider or ""),
             "Age": self.age_category.value
             if self.age_category
@@ -289,12 +309,12 @@ class ParsedCase(BaseModel):
             return self.anesthesia_type
         return None
 
-    def is_low_confidence(self, threshold: float = 0.7) -> bool:
+    def is_low_confidence(self, threshold: float = LOW_CONFIDENCE_THRESHOLD) -> bool:
         """Return True if the overall confidence score falls below threshold.
 
         Args:
             threshold: Minimum acceptable confidence in the range 0.0-1.0.
-                Defaults to 0.7.
+                Defaults to LOW_CONFIDENCE_THRESHOLD (0.7).
 
         Returns:
             True if confidence_score < threshold, False otherwise.
@@ -14,23 +14,30 @@ from __future__ import annotations
 
 import math
 import re
+from functools import lru_cache
 from numbers import Real
 
 import pandas as pd
 
 from .patterns import (
     extract_airway_management,
+    extract_airway_management_batch,
     extract_monitoring,
+    extract_monitoring_batch,
     extract_vascular_access,
+    extract_vascular_access_batch,
 )
 from .types import Scalar
 
 __all__ = [
     "clean_names",
     "extract_airway_management",
+    "extract_airway_management_batch",
     "extract_attending",
     "extract_monitoring",
+    "extract_monitoring_batch",
     "extract_vascular_access",
+    "extract_vascular_access_batch",
 ]
 
 
@@ -65,8 +72,17 @@ def clean_names(name: object) -> str:
     """
     if _is_missing_scalar(name):
         return ""
+    return _clean_name_text(str(name))
+
+
+@lru_cache(maxsize=32768)
+def _clean_name_text(name: str) -> str:
+    """Cached implementation of clean_names() for a present name.
+
+    Provider columns repeat a small roster of names across many rows.
+    """
     # Take only the first attending if multiple are listed
-    name = str(name).split(";")[0].strip()
+    name = name.split(";", maxsplit=1)[0].strip()
     # Remove titles
     name = re.sub(r"\b(MD|DO|PhD|CRNA|RN)\b", "", name, flags=re.IGNORECASE).strip()
     # Remove trailing commas and extra whitespace
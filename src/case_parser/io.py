@@ -8,16 +8,22 @@ Behavioral assumption:
 from __future__ import annotations
 
 import logging
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from itertools import starmap
 from pathlib import Path
+from time import perf_counter
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from openpyxl.utils import get_column_letter
 from pandas import DataFrame
 
-from .extractors import extract_attending
 from .models import (
     FORMAT_TYPE_CASELOG,
     OUTPUT_FORMAT_VERSION,
@@ -32,13 +38,49 @@ _RESERVED_SHEET_NAMES = {"info", "_meta"}
 _CASE_LEVEL_TECHNIQUE_MIN_RANK = 2
 DEFAULT_ORPHAN_AGE = 30
 
+# MPOG export columns consumed downstream. Everything else in the supervised
+# export is skipped at parse time.
+_CASE_LIST_COLUMNS = (
+    "MPOG_Case_ID",
+    "AIMS_Scheduled_DT",
+    "AIMS_Patient_Age_Years",
+    "ASA_Status",
+    "AIMS_Actual_Procedure_Text",
+    "AnesAttendings",
+)
+_PROCEDURE_LIST_COLUMNS = (
+    "MPOG_Case_ID",
+    "AIMS_Scheduled_DT",
+    "ASA_Status",
+    "Emergency",
+    "ProcedureName",
+    "PrimaryBlock",
+    "Comment",
+    "Details",
+    "AIMS_Actual_Procedure_Text",
+    "AnesAttendingNames",
+)
+# Pin dtypes so both parser engines agree: ages stay numeric, everything else
+# (including ASA values like "3E" and timestamp strings) stays text.
+_CSV_NUMERIC_DTYPES = {"AIMS_Patient_Age_Years": "float64"}
+_CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+_CSV_PAIR_MAX_WORKERS = 8
+# Text before the first ";" (next attending) or "@" (timestamp suffix).
+_ATTENDING_PREFIX_PATTERN = r"^([^;@]*)"
+# TECHNIQUE_RANK as sorted parallel arrays for vectorized searchsorted lookups.
+_TECHNIQUE_NAMES = np.array(sorted(TECHNIQUE_RANK), dtype=object)
+_TECHNIQUE_RANKS = np.array(
+    [TECHNIQUE_RANK[name] for name in _TECHNIQUE_NAMES], dtype=np.int8
+)
+
 
 def _combine_non_empty_text(*values: Scalar) -> str | None:
     """Join distinct non-empty text fields while preserving first-seen order."""
     parts: list[str] = []
     seen: set[str] = set()
     for value in values:
-        if pd.isna(value):
+        # Text cells, the common case, skip the pd.isna() dispatch.
+        if type(value) is not str and (value is None or pd.isna(value)):
             continue
         text = str(value).strip()
         if not text or text in seen:
@@ -76,10 +118,30 @@ def _assemble_airway_detail(
 
 
 def _extract_attending_column(df: DataFrame, column_name: str) -> pd.Series:
-    """Return normalized attending names when a source column is present."""
+    """Return normalized attending names when a source column is present.
+
+    Vectorized equivalent of ``extractors.extract_attending``: keep the first
+    semicolon-separated entry and drop its ``@timestamp`` suffix.
+    """
     if column_name not in df.columns:
         return pd.Series([pd.NA] * len(df), index=df.index)
-    return df[column_name].apply(extract_attending)
+    # One anchored extract replaces two split passes; it runs as an Arrow
+    # kernel when pandas stores the strings in pyarrow.
+    return (
+        df[column_name]
+        .astype("string")
+        .str.extract(_ATTENDING_PREFIX_PATTERN, expand=False)
+        .str.strip()
+        .fillna("")
+    )
+
+
+def _read_export_csv(path: Path, columns: tuple[str, ...]) -> DataFrame:
+    """Read only the consumed columns of one MPOG export CSV with pinned dtypes."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [column for column in header if column in columns]
+    dtypes = {column: _CSV_NUMERIC_DTYPES.get(column, "str") for column in usecols}
+    return pd.read_csv(path, engine=_CSV_ENGINE, usecols=usecols, dtype=dtypes)
 
 
 def _empty_procedure_aggregate() -> DataFrame:
@@ -87,6 +149,16 @@ def _empty_procedure_aggregate() -> DataFrame:
     return pd.DataFrame(columns=["MPOG_Case_ID", "Airway_Type"])
 
 
+def _technique_ranks(names: np.ndarray) -> np.ndarray:
+    """Return TECHNIQUE_RANK values for names, with 0 for unranked names."""
+    positions = np.minimum(
+        np.searchsorted(_TECHNIQUE_NAMES, names), len(_TECHNIQUE_NAMES) - 1
+    )
+    return np.where(
+        _TECHNIQUE_NAMES[positions] == names, _TECHNIQUE_RANKS[positions], 0
+    ).astype(np.int8)
+
+
 def _aggregate_case_procedures(matched_procs: DataFrame) -> DataFrame:
     """Reduce matched ProcedureList rows to one primary procedure per case."""
     if matched_procs.empty:
@@ -99,25 +171,25 @@ def _aggregate_case_procedures(matched_procs: DataFrame) -> DataFrame:
         ranked_columns.append("Details")
 
     ranked_procs = matched_procs.loc[
-        matched_procs["ProcedureName"].notna(),
-        ranked_columns,
-    ].copy()
+        matched_procs["ProcedureName"].notna(), ranked_columns
+    ].reset_index(drop=True)
     if ranked_procs.empty:
         return _empty_procedure_aggregate()
 
-    ranked_procs["_technique_rank"] = (
-        ranked_procs["ProcedureName"].map(TECHNIQUE_RANK).fillna(0)
+    # Rank and group on integer codes: distinct ProcedureNames are ranked in
+    # one vectorized lookup, and case IDs are hashed once by factorize instead
+    # of again inside groupby.
+    procedure_names = ranked_procs["ProcedureName"].astype("category")
+    ranks_by_code = _technique_ranks(
+        procedure_names.cat.categories.to_numpy(dtype=object)
     )
-    primary_procs = (
-        ranked_procs
-        .sort_values(
-            by=["MPOG_Case_ID", "_technique_rank"],
-            ascending=[True, False],
-            kind="stable",
-        )
-        .drop_duplicates(subset="MPOG_Case_ID", keep="first")
-        .reset_index(drop=True)
+    ranked_procs["_technique_rank"] = ranks_by_code[procedure_names.cat.codes]
+    case_codes, _case_ids = pd.factorize(
+        ranked_procs["MPOG_Case_ID"], use_na_sentinel=False
     )
+    # idxmax keeps the first row per case on rank ties, matching export order.
+    primary_idx = ranked_procs.groupby(case_codes)["_technique_rank"].idxmax()
+    primary_procs = ranked_procs.loc[primary_idx].reset_index(drop=True)
     primary_procs["Airway_Type"] = primary_procs["ProcedureName"]
     primary_procs["Airway_Details"] = list(
         starmap(
@@ -151,7 +223,28 @@ class ExcelWriteOptions:
 # ---------------------------------------------------------------------------
 
 
-def read_excel(file_path: str | Path, sheet_name: str | int | None = 0) -> DataFrame:
+def _excel_engine_options(file_path: Path, *, read_only: bool) -> dict[str, Any]:
+    """Return pd.read_excel engine arguments for the workbook format."""
+    if file_path.suffix.lower() == ".xlsx":
+        return {
+            "engine": "openpyxl",
+            "engine_kwargs": {"read_only": read_only, "data_only": True},
+        }
+    if not read_only:
+        logger.warning(
+            "read_only=False has no effect for legacy .xls file %s", file_path
+        )
+    return {}
+
+
+def read_excel(
+    file_path: str | Path,
+    sheet_name: str | int | None = 0,
+    *,
+    read_only: bool = True,
+    nrows: int | None = None,
+    skiprows: int | None = None,
+) -> DataFrame:
     """Read an Excel file and return a DataFrame.
 
     Args:
@@ -159,6 +252,13 @@ def read_excel(file_path: str | Path, sheet_name: str | int | None = 0) -> DataF
         sheet_name: Sheet name or index to read. ``None`` is not supported
             because this helper intentionally rejects pandas' load-all-sheets
             behavior.
+        read_only: Open ``.xlsx`` workbooks in openpyxl's streaming read-only
+            mode. Disable for workbooks whose stored sheet dimensions are
+            wrong, which read-only mode trusts and may truncate. Ignored for
+            legacy ``.xls`` files.
+        nrows: Maximum number of data rows to parse. ``None`` reads all rows.
+        skiprows: Number of data rows to skip after the header row before
+            parsing. ``None`` or ``0`` skips nothing.
 
     Returns:
         DataFrame containing the sheet data
@@ -184,9 +284,17 @@ def read_excel(file_path: str | Path, sheet_name: str | int | None = 0) -> DataF
             "sheet_name=None is not supported; provide a sheet name or index"
         )
 
+    engine_options = _excel_engine_options(file_path, read_only=read_only)
     try:
         logger.info("Reading Excel file: %s", file_path)
-        result = pd.read_excel(file_path, sheet_name=sheet_name)
+        result = pd.read_excel(
+            file_path,
+            sheet_name=sheet_name,
+            nrows=nrows,
+            # Offset past the header row so skiprows counts data rows only.
+            skiprows=range(1, skiprows + 1) if skiprows else None,
+            **engine_options,
+        )
         if isinstance(result, dict):
             raise TypeError(
                 "Multiple sheets returned. Please specify a single sheet name or index."
@@ -363,6 +471,9 @@ class ExcelHandler:
 def discover_csv_pairs(directory: Path) -> list[tuple[Path, Path]]:
     """Discover matching CaseList and ProcedureList CSV file pairs.
 
+    Results are cached per directory and invalidated when the directory's
+    modification time changes (files added, removed, or renamed).
+
     Args:
         directory: Directory to search for CSV files
 
@@ -373,7 +484,18 @@ def discover_csv_pairs(directory: Path) -> list[tuple[Path, Path]]:
         ValueError: If no matching pairs found
     """
     directory = Path(directory)
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = -1  # Never cached: a missing directory has no pairs and raises.
+    return list(_discover_csv_pairs_cached(directory, mtime_ns))
+
 
+@lru_cache(maxsize=32)
+def _discover_csv_pairs_cached(
+    directory: Path, mtime_ns: int
+) -> tuple[tuple[Path, Path], ...]:
+    """Glob and pair export files; ``mtime_ns`` only keys the cache."""
     case_files: dict[str, Path] = {}
     for f in directory.glob("*.CaseList.csv"):
         key = normalize_stem(f.name.replace(".CaseList.csv", ""))
@@ -412,9 +534,9 @@ def discover_csv_pairs(directory: Path) -> list[tuple[Path, Path]]:
             "<PREFIX>.CaseList.csv and <PREFIX>.ProcedureList.csv"
         )
 
-    pairs = [
+    pairs = tuple(
         (case_files[prefix], proc_files[prefix]) for prefix in sorted(common_prefixes)
-    ]
+    )
     logger.info("Discovered %d CSV pair(s)", len(pairs))
     return pairs
 
@@ -435,8 +557,10 @@ def join_case_and_procedures(
     """
     orphan_procs = pd.DataFrame(columns=proc_df.columns if not proc_df.empty else [])
     if not proc_df.empty:
-        orphan_mask = ~proc_df["MPOG_Case_ID"].isin(case_df["MPOG_Case_ID"])
-        orphan_procs = proc_df[orphan_mask].copy().reset_index(drop=True)
+        # Deduplicate case IDs first so isin hashes each ID once, not every row.
+        case_ids = case_df["MPOG_Case_ID"].unique()
+        orphan_mask = ~proc_df["MPOG_Case_ID"].isin(case_ids)
+        orphan_procs = proc_df.loc[orphan_mask].reset_index(drop=True)
         if not orphan_procs.empty:
             logger.info(
                 "Found %d orphan procedure(s) with no matching case", len(orphan_procs)
@@ -459,6 +583,18 @@ def join_case_and_procedures(
     return result, orphan_procs
 
 
+def _read_csv_pair(pair: tuple[Path, Path]) -> tuple[DataFrame, DataFrame]:
+    """Read one CaseList/ProcedureList pair and join it."""
+    case_file, proc_file = pair
+    logger.info("Reading pair: %s, %s", case_file.name, proc_file.name)
+    started = perf_counter()
+    case_df = _read_export_csv(case_file, _CASE_LIST_COLUMNS)
+    proc_df = _read_export_csv(proc_file, _PROCEDURE_LIST_COLUMNS)
+    joined, orphan_procs = join_case_and_procedures(case_df, proc_df)
+    logger.debug("Read pair %s in %.3fs", case_file.name, perf_counter() - started)
+    return joined, orphan_procs
+
+
 class CsvHandler:
     """Handles MPOG supervised-export CSV v2 format reading."""
 
@@ -489,17 +625,32 @@ class CsvHandler:
         directory = Path(directory)
         pairs = discover_csv_pairs(directory)
 
-        all_dfs: list[DataFrame] = []
-        all_orphan_dfs: list[DataFrame] = []
-        for case_file, proc_file in pairs:
-            logger.info("Reading pair: %s, %s", case_file.name, proc_file.name)
-            case_df = pd.read_csv(case_file)
-            proc_df = pd.read_csv(proc_file)
-            joined, orphan_procs = join_case_and_procedures(case_df, proc_df)
-            all_dfs.append(joined)
-            if not orphan_procs.empty:
-                all_orphan_dfs.append(orphan_procs)
-
+        # CSV parsing and the join spend most of their time in pandas C code
+        # that releases the GIL, so pairs are read concurrently. map() keeps
+        # results in discover_csv_pairs order.
+        if len(pairs) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_CSV_PAIR_MAX_WORKERS, len(pairs))
+            ) as executor:
+                pair_results = list(executor.map(_read_csv_pair, pairs))
+        else:
+            pair_results = [_read_csv_pair(pair) for pair in pairs]
+
+        all_dfs = [joined for joined, _orphans in pair_results]
+        all_orphan_dfs = [
+            orphan_procs
+            for _joined, orphan_procs in pair_results
+            if not orphan_procs.empty
+        ]
+
+        # pandas 3 copy-on-write already makes concat avoid defensive copies
+        # (its copy= keyword is deprecated), so just report the size up front
+        # to make memory pressure on large batches easy to attribute.
+        logger.debug(
+            "Combining %d joined row(s) from %d file pair(s)",
+            sum(len(df) for df in all_dfs),
+            len(all_dfs),
+        )
         combined = pd.concat(all_dfs, ignore_index=True)
         result = self.normalize_columns(combined)
         logger.info(
@@ -531,18 +682,21 @@ class CsvHandler:
             DataFrame with columns matching self.column_map field values.
         """
         column_map = self.column_map
-        result = csv_df.rename(
-            columns={
-                "MPOG_Case_ID": column_map.episode_id,
-                "AIMS_Scheduled_DT": column_map.date,
-                "AIMS_Patient_Age_Years": column_map.age,
-                "ASA_Status": column_map.asa,
-                "AIMS_Actual_Procedure_Text": column_map.procedure,
-                "Airway_Type": column_map.final_anesthesia_type,
-            }
-        )
-
-        result[column_map.anesthesiologist] = _extract_attending_column(
+        renames = {
+            "MPOG_Case_ID": column_map.episode_id,
+            "AIMS_Scheduled_DT": column_map.date,
+            "AIMS_Patient_Age_Years": column_map.age,
+            "ASA_Status": column_map.asa,
+            "AIMS_Actual_Procedure_Text": column_map.procedure,
+            "Airway_Type": column_map.final_anesthesia_type,
+        }
+        # Assemble every output column first and build the frame once, so the
+        # derived columns do not each trigger a block insert on a large frame.
+        columns: dict[Hashable, pd.Series | list[str | None] | str] = {
+            renames.get(name, name): values for name, values in csv_df.items()
+        }
+
+        columns[column_map.anesthesiologist] = _extract_attending_column(
             csv_df,
             "AnesAttendings",
         )
@@ -552,13 +706,15 @@ class CsvHandler:
         # so downstream airway/anesthesia inference can use more than the coarse
         # ProcedureName label.
         if "Airway_Type" in csv_df.columns:
-            result[column_map.procedure_notes] = _combine_text_columns(
+            columns[column_map.procedure_notes] = _combine_text_columns(
                 _column_or_default(csv_df, "Airway_Type"),
                 _column_or_default(csv_df, "Airway_Details"),
             )
 
         # CSV v2 has no Services column — derive from procedure text during processing.
-        result[column_map.services] = ""
+        columns[column_map.services] = ""
+
+        result = pd.DataFrame(columns, index=csv_df.index, copy=False)
 
         # Ensure all standard columns exist so downstream consumers have a
         # consistent schema.
@@ -602,30 +758,27 @@ class CsvHandler:
             DataFrame with columns matching self.column_map field values.
         """
         column_map = self.column_map
-        result = pd.DataFrame(index=orphan_df.index)
-
-        result[column_map.episode_id] = orphan_df.get("MPOG_Case_ID")
-        result[column_map.date] = orphan_df.get("AIMS_Scheduled_DT")
-        result[column_map.asa] = orphan_df.get("ASA_Status")
-        result[column_map.emergent] = orphan_df.get("Emergency")
-        result[column_map.final_anesthesia_type] = orphan_df.get("ProcedureName")
-        result[column_map.nerve_block_type] = orphan_df.get("PrimaryBlock")
-        result[column_map.procedure] = orphan_df.get("AIMS_Actual_Procedure_Text")
-        result[column_map.services] = ""
-
-        result[column_map.procedure_notes] = _combine_text_columns(
-            _column_or_default(orphan_df, "ProcedureName"),
-            _column_or_default(orphan_df, "Comment"),
-            _column_or_default(orphan_df, "Details"),
-        )
-
-        result[column_map.anesthesiologist] = _extract_attending_column(
-            orphan_df,
-            "AnesAttendingNames",
-        )
-
-        result[column_map.age] = (
-            DEFAULT_ORPHAN_AGE  # Maps orphan procedures to the adult 12-65 range.
-        )
+        columns: dict[Hashable, pd.Series | list[str | None] | str | int | None] = {
+            column_map.episode_id: orphan_df.get("MPOG_Case_ID"),
+            column_map.date: orphan_df.get("AIMS_Scheduled_DT"),
+            column_map.asa: orphan_df.get("ASA_Status"),
+            column_map.emergent: orphan_df.get("Emergency"),
+            column_map.final_anesthesia_type: orphan_df.get("ProcedureName"),
+            column_map.nerve_block_type: orphan_df.get("PrimaryBlock"),
+            column_map.procedure: orphan_df.get("AIMS_Actual_Procedure_Text"),
+            column_map.services: "",
+            column_map.procedure_notes: _combine_text_columns(
+                _column_or_default(orphan_df, "ProcedureName"),
+                _column_or_default(orphan_df, "Comment"),
+                _column_or_default(orphan_df, "Details"),
+            ),
+            column_map.anesthesiologist: _extract_attending_column(
+                orphan_df,
+                "AnesAttendingNames",
+            ),
+            # Maps orphan procedures to the adult 12-65 range.
+            column_map.age: DEFAULT_ORPHAN_AGE,
+        }
+        result = pd.DataFrame(columns, index=orphan_df.index, copy=False)
 
         return result.reset_index(drop=True)
@@ -4,10 +4,26 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 from typing import Literal
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_SETUP_LOCK = threading.Lock()
+_LOGGING_STATE: dict[str, logging.StreamHandler | None] = {"handler": None}
+
+
+def _is_configured(root_logger: logging.Logger, log_level: int) -> bool:
+    """Return whether the root logger still has our handler at ``log_level``."""
+    handler = _LOGGING_STATE["handler"]
+    return (
+        handler is not None
+        and root_logger.handlers == [handler]
+        and root_logger.level == log_level
+        and handler.level == log_level
+        and handler.stream is sys.stdout
+    )
+
 
 def setup_logging(level: LogLevel = "INFO", verbose: bool = False) -> None:
     """Set up logging configuration for the application.
@@ -20,25 +36,32 @@ def setup_logging(level: LogLevel = "INFO", verbose: bool = False) -> None:
         level: Desired log level string ("DEBUG", "INFO", "WARNING", "ERROR",
             or "CRITICAL"). Ignored when verbose is True.
         verbose: If True, forces DEBUG level regardless of the level argument.
+
+    Repeated calls that would install an identical setup are no-ops.
     """
     log_level = logging.DEBUG if verbose else getattr(logging, level.upper())
 
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    with _SETUP_LOCK:
+        root_logger = logging.getLogger()
+        if _is_configured(root_logger, log_level):
+            return
+
+        # Create formatter
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
-    # Set up console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
+        # Set up console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(formatter)
 
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.handlers.clear()
-    root_logger.addHandler(console_handler)
+        # Configure root logger
+        root_logger.setLevel(log_level)
+        root_logger.handlers.clear()
+        root_logger.addHandler(console_handler)
+        _LOGGING_STATE["handler"] = console_handler
 
     # Set specific logger levels
     logging.getLogger("openpyxl").setLevel(logging.WARNING)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import pickle  # noqa: S403
+import hashlib
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
 from numpy.typing import NDArray
 from sklearn.base import BaseEstimator
@@ -17,6 +20,58 @@ from ..types import Scalar
 from .config import get_default_ml_inference_jobs, normalize_ml_inference_jobs
 from .inputs import FeatureInput, build_feature_inputs
 
+# Procedure texts repeat heavily across a case log; probability rows are cached
+# per normalized feature input so duplicates skip feature extraction entirely.
+_PROBA_CACHE_MAXSIZE = 4096
+MODEL_CHECKSUM_SUFFIX = ".sha256"
+
+
+def model_checksum_path(model_path: Path) -> Path:
+    """Return the SHA-256 sidecar path for a model artifact."""
+    return model_path.with_name(model_path.name + MODEL_CHECKSUM_SUFFIX)
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's bytes."""
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def write_model_checksum(model_path: Path) -> Path:
+    """Write a ``sha256sum``-compatible sidecar next to a model artifact.
+
+    Args:
+        model_path: Path to the saved model artifact.
+
+    Returns:
+        Path of the written sidecar file.
+    """
+    checksum_path = model_checksum_path(model_path)
+    checksum_path.write_text(
+        f"{_file_sha256(model_path)}  {model_path.name}\n", encoding="utf-8"
+    )
+    return checksum_path
+
+
+def _verify_model_checksum(model_path: Path) -> None:
+    """Reject a model whose bytes do not match its SHA-256 sidecar.
+
+    Artifacts without a sidecar are loaded as before.
+
+    Raises:
+        ValueError: If a sidecar exists and the digest does not match.
+    """
+    checksum_path = model_checksum_path(model_path)
+    if not checksum_path.exists():
+        return
+    expected = checksum_path.read_text(encoding="utf-8").split(maxsplit=1)
+    actual = _file_sha256(model_path)
+    if not expected or expected[0].lower() != actual:
+        raise ValueError(
+            f"Model checksum mismatch for {model_path}: "
+            f"expected {expected[0] if expected else '<empty>'}, got {actual}"
+        )
+
 
 class ProcedureMLPipeline:
     """Inference pipeline that combines feature extraction and estimator."""
@@ -91,6 +146,29 @@ class ProcedureMLPipeline:
         feature_matrix = self.features.transform(texts)
         return self.model.predict_proba(feature_matrix)
 
+    def predict_with_proba(
+        self,
+        procedures: Iterable[str | FeatureInput | Mapping[str, Scalar]]
+        | str
+        | FeatureInput
+        | Mapping[str, Scalar],
+    ) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+        """Return labels and class probabilities from one feature transform.
+
+        Args:
+            procedures: Single procedure input or iterable of inputs, as
+                accepted by :meth:`predict`.
+
+        Returns:
+            Tuple of (labels, probabilities) matching :meth:`predict` and
+            :meth:`predict_proba` for the same inputs.
+        """
+        texts = self._coerce_inputs(procedures)
+        feature_matrix = self.features.transform(texts)
+        return self.model.predict(feature_matrix), self.model.predict_proba(
+            feature_matrix
+        )
+
 
 class MLPredictor:
     """Wrapper for trained ML model."""
@@ -111,6 +189,8 @@ class MLPredictor:
         self.pipeline = pipeline
         self.metadata = metadata
         self.inference_jobs = inference_jobs
+        self._proba_cache: OrderedDict[FeatureInput, NDArray[Any]] = OrderedDict()
+        self._proba_cache_lock = threading.Lock()
 
     @staticmethod
     def _iter_estimator_children(estimator: BaseEstimator) -> list[BaseEstimator]:
@@ -171,7 +251,11 @@ class MLPredictor:
         model_path: Path,
         inference_jobs: int | None = None,
     ) -> MLPredictor:
-        """Load model from pickle file.
+        """Load model from a joblib/pickle file.
+
+        When a ``<model>.sha256`` sidecar exists the artifact bytes are verified
+        before anything is unpickled. Large numpy arrays saved by
+        ``joblib.dump`` are memory-mapped read-only rather than copied.
 
         Args:
             model_path: Path to model pickle file
@@ -183,14 +267,14 @@ class MLPredictor:
 
         Raises:
             FileNotFoundError: If model file doesn't exist
-            ValueError: If the pickle artifact is missing the expected
-                ``pipeline`` key.
+            ValueError: If the artifact fails its checksum or is missing the
+                expected ``pipeline`` key.
         """
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
 
-        with model_path.open("rb") as f:
-            model_data = pickle.load(f)  # noqa: S301
+        _verify_model_checksum(model_path)
+        model_data = joblib.load(model_path, mmap_mode="r")
 
         if "pipeline" not in model_data:
             raise ValueError(
@@ -264,18 +348,51 @@ class MLPredictor:
         rule_categories: list[str] | None = None,
         rule_warning_counts: list[int] | None = None,
     ) -> NDArray[Any]:
-        """Get prediction probabilities for multiple procedures."""
+        """Get prediction probabilities for multiple procedures.
+
+        Rows are served from a bounded LRU cache keyed by the normalized
+        feature input; only unseen inputs are sent through the pipeline, once
+        each.
+        """
         if not procedure_texts:
             n_classes = len(getattr(self.pipeline, "classes_", []))
             return np.empty((0, n_classes))
-        return self.pipeline.predict_proba(
-            build_feature_inputs(
-                procedure_texts,
-                services_list=services_list,
-                rule_categories=rule_categories,
-                rule_warning_counts=rule_warning_counts,
-            )
+        feature_inputs = build_feature_inputs(
+            procedure_texts,
+            services_list=services_list,
+            rule_categories=rule_categories,
+            rule_warning_counts=rule_warning_counts,
         )
+        rows = self._cached_proba_rows(feature_inputs)
+        missing = [item for item in dict.fromkeys(feature_inputs) if item not in rows]
+        if missing:
+            computed = dict(
+                zip(missing, self.pipeline.predict_proba(missing), strict=True)
+            )
+            self._store_proba_rows(computed)
+            rows.update(computed)
+        return np.vstack([rows[item] for item in feature_inputs])
+
+    def _cached_proba_rows(
+        self, feature_inputs: Sequence[FeatureInput]
+    ) -> dict[FeatureInput, NDArray[Any]]:
+        """Return cached probability rows for any of ``feature_inputs``."""
+        rows: dict[FeatureInput, NDArray[Any]] = {}
+        with self._proba_cache_lock:
+            for item in feature_inputs:
+                row = self._proba_cache.get(item)
+                if row is not None:
+                    self._proba_cache.move_to_end(item)
+                    rows[item] = row
+        return rows
+
+    def _store_proba_rows(self, rows: Mapping[FeatureInput, NDArray[Any]]) -> None:
+        """Cache probability rows, evicting the least recently used ones."""
+        with self._proba_cache_lock:
+            for item, row in rows.items():
+                self._proba_cache[item] = row.copy()
+            while len(self._proba_cache) > _PROBA_CACHE_MAXSIZE:
+                self._proba_cache.popitem(last=False)
 
     def get_confidence(self, procedure_text: str) -> float:
         """Get confidence (max probability) for prediction.
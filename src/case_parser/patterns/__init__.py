@@ -17,7 +17,7 @@ PATTERN MODULES:
 - anesthesia_patterns: Anesthesia type mapping
 """
 
-from .age_patterns import AGE_RANGES
+from .age_patterns import AGE_RANGES, categorize_ages
 from .airway_patterns import (
     BRONCHOSCOPY_PATTERNS,
     DIFFICULT_AIRWAY_PATTERNS,
@@ -28,6 +28,7 @@ from .airway_patterns import (
     SUPRAGLOTTIC_PATTERNS,
     VIDEO_LARYNGOSCOPY_PATTERNS,
     extract_airway_management,
+    extract_airway_management_batch,
 )
 from .anesthesia_patterns import (
     ANESTHESIA_MAPPING,
@@ -48,6 +49,7 @@ from .monitoring_patterns import (
     INVASIVE_NEURO_PATTERNS,
     TEE_PATTERNS,
     extract_monitoring,
+    extract_monitoring_batch,
 )
 from .procedure_patterns import PROCEDURE_RULES
 from .vascular_access_patterns import (
@@ -55,6 +57,7 @@ from .vascular_access_patterns import (
     CENTRAL_LINE_PATTERNS,
     PA_CATHETER_PATTERNS,
     extract_vascular_access,
+    extract_vascular_access_batch,
 )
 
 __all__ = [
@@ -81,10 +84,14 @@ __all__ = [
     "TEE_PATTERNS",
     "VASCULAR_PATHOLOGY_KEYWORDS",
     "VIDEO_LARYNGOSCOPY_PATTERNS",
+    "categorize_ages",
     "categorize_procedure",
     "detect_approach",
     "detect_intracerebral_pathology",
     "extract_airway_management",
+    "extract_airway_management_batch",
     "extract_monitoring",
+    "extract_monitoring_batch",
     "extract_vascular_access",
+    "extract_vascular_access_batch",
 ]
@@ -32,8 +32,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AgeRange:
     """Age range with upper bound and category label."""
 
@@ -72,3 +75,29 @@ AGE_RANGES = [
         category="e. >= 65 year",
     ),
 ]
+
+# Sorted upper bounds and their labels, built once so batches can bucket every
+# age with a single binary search instead of scanning AGE_RANGES per value.
+_AGE_UPPER_BOUNDS = np.array([range_.upper_bound for range_ in AGE_RANGES])
+_AGE_LABELS = np.array([range_.category for range_ in AGE_RANGES], dtype=object)
+
+
+def categorize_ages(ages: ArrayLike) -> list[str | None]:
+    """Return the AGE_RANGES label for each age in years.
+
+    Matches the ordered ``age < upper_bound`` scan: ``side="right"`` sends an
+    age equal to a bound into the next range, and NaN (or anything past the
+    last bound) yields None.
+
+    Args:
+        ages: Ages in years; missing values should be NaN.
+
+    Returns:
+        Category labels aligned with ``ages``.
+    """
+    values = np.asarray(ages, dtype=float)
+    indexes = np.searchsorted(_AGE_UPPER_BOUNDS, values, side="right")
+    in_range = indexes < len(_AGE_LABELS)
+    labels = np.full(values.shape, None, dtype=object)
+    labels[in_range] = _AGE_LABELS[indexes[in_range]]
+    return labels.tolist()
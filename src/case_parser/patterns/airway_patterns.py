@@ -21,15 +21,20 @@ Patterns are case-insensitive and use standard Python regex syntax.
 
 from __future__ import annotations
 
-import re
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from ..domain import AirwayManagement, ExtractionFinding
 from .extraction_utils import (
-    calculate_pattern_confidence,
-    extract_with_context,
-    remove_duplicates_preserve_order,
+    SATURATED_MATCH_COUNT,
+    FoldedAlternation,
+    batch_pattern_hits,
+    compile_patterns,
+    confidence_from_counts,
+    count_matching_patterns,
+    fold_ascii,
 )
 
 # ============================================================================
@@ -130,74 +135,116 @@ NEGATION_PATTERNS = [
     r"\battempted\s+but\s+not\b",
 ]
 
+# Compiled once at import; the lists above stay the editable source of truth.
+_NASAL_ANY = FoldedAlternation.compile([r"\bnasal\b"])
+# One fused alternation per category answers "any pattern matches" and finds
+# the first-match context in a single pass; its member patterns serve the
+# supporting/negation counts, which are per pattern.
+_INTUBATION_ANY = FoldedAlternation.compile(INTUBATION_PATTERNS)
+_DOUBLE_LUMEN_ANY = FoldedAlternation.compile(DOUBLE_LUMEN_PATTERNS)
+_DIRECT_LARYNGOSCOPY_ANY = FoldedAlternation.compile(DIRECT_LARYNGOSCOPY_PATTERNS)
+_VIDEO_LARYNGOSCOPY_ANY = FoldedAlternation.compile(VIDEO_LARYNGOSCOPY_PATTERNS)
+_SUPRAGLOTTIC_ANY = FoldedAlternation.compile(SUPRAGLOTTIC_PATTERNS)
+_BRONCHOSCOPY_ANY = FoldedAlternation.compile(BRONCHOSCOPY_PATTERNS)
+_MASK_VENTILATION_ANY = FoldedAlternation.compile(MASK_VENTILATION_PATTERNS)
+_DIFFICULT_AIRWAY_ANY = FoldedAlternation.compile(DIFFICULT_AIRWAY_PATTERNS)
+# Union of every group that can produce a finding on its own (nasal and the
+# laryngoscopy groups only qualify an intubation). Notes missing it have no
+# airway findings, so one search rules them out before the per-group scans.
+_AIRWAY_SENTINEL = FoldedAlternation.compile([
+    *INTUBATION_PATTERNS,
+    *DOUBLE_LUMEN_PATTERNS,
+    *SUPRAGLOTTIC_PATTERNS,
+    *BRONCHOSCOPY_PATTERNS,
+    *MASK_VENTILATION_PATTERNS,
+    *DIFFICULT_AIRWAY_PATTERNS,
+])
+# Most notes carry no negation cue; one fused search rules that out before the
+# per-pattern count, which confidence scoring needs only when a cue exists.
+_NEGATION_ANY = FoldedAlternation.compile(NEGATION_PATTERNS)
+_ETT_SUPPORT_RE = compile_patterns([r"\bintubat(ed|ion|e)?\b", r"\bETT\b"])
+
+
+# Hit flags computed per note before findings are built. The batch extractor
+# computes the same flags for a whole column through batch_pattern_hits.
+_AIRWAY_HIT_PATTERNS = (
+    ("intubation", _INTUBATION_ANY),
+    ("double_lumen", _DOUBLE_LUMEN_ANY),
+    ("nasal", _NASAL_ANY),
+    ("direct_laryngoscopy", _DIRECT_LARYNGOSCOPY_ANY),
+    ("video_laryngoscopy", _VIDEO_LARYNGOSCOPY_ANY),
+    ("supraglottic", _SUPRAGLOTTIC_ANY),
+    ("bronchoscopy", _BRONCHOSCOPY_ANY),
+    ("mask_ventilation", _MASK_VENTILATION_ANY),
+    ("difficult_airway", _DIFFICULT_AIRWAY_ANY),
+)
+# Hit-matrix columns that produce findings on their own; "nasal" only
+# qualifies an intubation finding.
+_AIRWAY_FINDING_COLUMNS = [
+    column for column, (name, _) in enumerate(_AIRWAY_HIT_PATTERNS) if name != "nasal"
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _AirwayHits:
+    """Which airway pattern groups match a note."""
+
+    intubation: bool
+    double_lumen: bool
+    nasal: bool
+    direct_laryngoscopy: bool
+    video_laryngoscopy: bool
+    supraglottic: bool
+    bronchoscopy: bool
+    mask_ventilation: bool
+    difficult_airway: bool
+
 
 # ============================================================================
 # EXTRACTION FUNCTION
 # ============================================================================
 
 
-def extract_airway_management(  # noqa: PLR0914, PLR0915
-    notes: str | None, source_field: str = "procedure_notes"
+def _build_airway_results(
+    text: str, hits: _AirwayHits, source_field: str
 ) -> tuple[list[AirwayManagement], list[ExtractionFinding]]:
-    """
-    Extract airway management techniques with pattern matching and confidence scoring.
-
-    This function analyzes procedure notes to identify:
-    - Type of intubation (oral vs nasal ETT)
-    - Laryngoscopy technique (direct vs video)
-    - Alternative airways (LMA, mask ventilation)
-    - Special techniques (bronchoscopy)
-    - Difficult airway encounters
+    """Build techniques and findings for a note whose hit flags are known.
 
-    Args:
-        notes: Procedure notes text (can be None, NaN, or string)
-        source_field: Name of the field being analyzed (for tracking)
-
-    Returns:
-        Tuple of (airway_management_list, extraction_findings)
-        - airway_management_list: List of AirwayManagement enums found
-        - extraction_findings: List of ExtractionFinding objects with confidence scores
-
-    Example:
-        notes = "Patient intubated with video laryngoscopy"
-        techniques, findings = extract_airway_management(notes)
-        # techniques: [AirwayManagement.ORAL_ETT, AirwayManagement.VIDEO_LARYNGOSCOPE]
+    Every finding's primary pattern group is known to match from ``hits``, so
+    confidence only needs the supporting/negation counts, each counted once
+    per note and shared across findings.
     """
-    if pd.isna(notes):
-        return [], []
-
-    text = str(notes)
     airway_techniques = []
     findings = []
-    has_nasal_route = bool(re.search(r"\bnasal\b", text, re.IGNORECASE))
+    folded_text = fold_ascii(text)
+    negation_matches = (
+        count_matching_patterns(text, _NEGATION_ANY.members, SATURATED_MATCH_COUNT)
+        if _NEGATION_ANY.search(text, folded_text)
+        else 0
+    )
+    # No intubation pattern can match when the fused intubation search missed.
+    intubation_matches = (
+        count_matching_patterns(text, _INTUBATION_ANY.members, SATURATED_MATCH_COUNT)
+        if hits.intubation
+        else 0
+    )
 
     # Check for intubation
-    double_lumen_matches = extract_with_context(text, DOUBLE_LUMEN_PATTERNS)
-    intubation_matches = extract_with_context(text, INTUBATION_PATTERNS)
-    if intubation_matches or double_lumen_matches:
+    if hits.intubation or hits.double_lumen:
         route_context = (
-            intubation_matches[0][1]
-            if intubation_matches
-            else double_lumen_matches[0][1]
-        )
-        route_patterns = (
-            [*INTUBATION_PATTERNS, *DOUBLE_LUMEN_PATTERNS]
-            if double_lumen_matches
-            else INTUBATION_PATTERNS
+            _INTUBATION_ANY.first_match_context(text, folded_text)
+            if hits.intubation
+            else _DOUBLE_LUMEN_ANY.first_match_context(text, folded_text)
         )
 
         # Determine if nasal vs oral
-        if has_nasal_route:
+        if hits.nasal:
             airway_techniques.append(AirwayManagement.NASAL_ETT)
-            confidence = calculate_pattern_confidence(
-                text, route_patterns, [r"\bnasal\b"], NEGATION_PATTERNS
-            )
+            confidence = confidence_from_counts(1, negation_matches)
             route_value = AirwayManagement.NASAL_ETT.value
         else:
             airway_techniques.append(AirwayManagement.ORAL_ETT)
-            confidence = calculate_pattern_confidence(
-                text, route_patterns, None, NEGATION_PATTERNS
-            )
+            confidence = confidence_from_counts(0, negation_matches)
             route_value = AirwayManagement.ORAL_ETT.value
 
         findings.append(
@@ -209,114 +256,178 @@ def extract_airway_management(  # noqa: PLR0914, PLR0915
             )
         )
 
-        if double_lumen_matches:
+        if hits.double_lumen:
             airway_techniques.append(AirwayManagement.DOUBLE_LUMEN_ETT)
-            confidence = calculate_pattern_confidence(
-                text,
-                DOUBLE_LUMEN_PATTERNS,
-                [r"\bintubat(ed|ion|e)?\b", r"\bETT\b"],
-                NEGATION_PATTERNS,
+            ett_matches = (
+                count_matching_patterns(text, _ETT_SUPPORT_RE, SATURATED_MATCH_COUNT)
+                if hits.intubation
+                else 0
             )
+            confidence = confidence_from_counts(ett_matches, negation_matches)
             findings.append(
                 ExtractionFinding(
                     value=AirwayManagement.DOUBLE_LUMEN_ETT.value,
                     confidence=confidence,
-                    context=double_lumen_matches[0][1],
+                    context=_DOUBLE_LUMEN_ANY.first_match_context(text, folded_text),
                     source_field=source_field,
                 )
             )
 
         # Check for laryngoscopy method
-        dl_matches = extract_with_context(text, DIRECT_LARYNGOSCOPY_PATTERNS)
-        if dl_matches:
+        if hits.direct_laryngoscopy:
             airway_techniques.append(AirwayManagement.DIRECT_LARYNGOSCOPE)
-            confidence = calculate_pattern_confidence(
-                text, DIRECT_LARYNGOSCOPY_PATTERNS, INTUBATION_PATTERNS
-            )
+            confidence = confidence_from_counts(intubation_matches, 0)
             findings.append(
                 ExtractionFinding(
                     value=AirwayManagement.DIRECT_LARYNGOSCOPE.value,
                     confidence=confidence,
-                    context=dl_matches[0][1],
+                    context=_DIRECT_LARYNGOSCOPY_ANY.first_match_context(
+                        text, folded_text
+                    ),
                     source_field=source_field,
                 )
             )
 
-        vl_matches = extract_with_context(text, VIDEO_LARYNGOSCOPY_PATTERNS)
-        if vl_matches:
+        if hits.video_laryngoscopy:
             airway_techniques.append(AirwayManagement.VIDEO_LARYNGOSCOPE)
-            confidence = calculate_pattern_confidence(
-                text, VIDEO_LARYNGOSCOPY_PATTERNS, INTUBATION_PATTERNS
-            )
+            confidence = confidence_from_counts(intubation_matches, 0)
             findings.append(
                 ExtractionFinding(
                     value=AirwayManagement.VIDEO_LARYNGOSCOPE.value,
                     confidence=confidence,
-                    context=vl_matches[0][1],
+                    context=_VIDEO_LARYNGOSCOPY_ANY.first_match_context(
+                        text, folded_text
+                    ),
                     source_field=source_field,
                 )
             )
 
     # Check for supraglottic airway
-    sga_matches = extract_with_context(text, SUPRAGLOTTIC_PATTERNS)
-    if sga_matches:
+    if hits.supraglottic:
         airway_techniques.append(AirwayManagement.SUPRAGLOTTIC_AIRWAY)
-        confidence = calculate_pattern_confidence(
-            text, SUPRAGLOTTIC_PATTERNS, None, NEGATION_PATTERNS
-        )
+        confidence = confidence_from_counts(0, negation_matches)
         findings.append(
             ExtractionFinding(
                 value=AirwayManagement.SUPRAGLOTTIC_AIRWAY.value,
                 confidence=confidence,
-                context=sga_matches[0][1],
+                context=_SUPRAGLOTTIC_ANY.first_match_context(text, folded_text),
                 source_field=source_field,
             )
         )
 
     # Check for bronchoscopy
-    bronch_matches = extract_with_context(text, BRONCHOSCOPY_PATTERNS)
-    if bronch_matches:
+    if hits.bronchoscopy:
         airway_techniques.append(AirwayManagement.FLEXIBLE_BRONCHOSCOPIC)
-        confidence = calculate_pattern_confidence(
-            text, BRONCHOSCOPY_PATTERNS, INTUBATION_PATTERNS
-        )
+        confidence = confidence_from_counts(intubation_matches, 0)
         findings.append(
             ExtractionFinding(
                 value=AirwayManagement.FLEXIBLE_BRONCHOSCOPIC.value,
                 confidence=confidence,
-                context=bronch_matches[0][1],
+                context=_BRONCHOSCOPY_ANY.first_match_context(text, folded_text),
                 source_field=source_field,
             )
         )
 
     # Check for mask ventilation
-    mask_matches = extract_with_context(text, MASK_VENTILATION_PATTERNS)
-    if mask_matches:
+    if hits.mask_ventilation:
         airway_techniques.append(AirwayManagement.MASK)
-        confidence = calculate_pattern_confidence(
-            text, MASK_VENTILATION_PATTERNS, None, NEGATION_PATTERNS
-        )
+        confidence = confidence_from_counts(0, negation_matches)
         findings.append(
             ExtractionFinding(
                 value=AirwayManagement.MASK.value,
                 confidence=confidence,
-                context=mask_matches[0][1],
+                context=_MASK_VENTILATION_ANY.first_match_context(text, folded_text),
                 source_field=source_field,
             )
         )
 
     # Check for difficult airway
-    difficult_matches = extract_with_context(text, DIFFICULT_AIRWAY_PATTERNS)
-    if difficult_matches:
+    if hits.difficult_airway:
         airway_techniques.append(AirwayManagement.DIFFICULT_AIRWAY)
-        confidence = calculate_pattern_confidence(text, DIFFICULT_AIRWAY_PATTERNS)
+        confidence = confidence_from_counts(0, 0)
         findings.append(
             ExtractionFinding(
                 value=AirwayManagement.DIFFICULT_AIRWAY.value,
                 confidence=confidence,
-                context=difficult_matches[0][1],
+                context=_DIFFICULT_AIRWAY_ANY.first_match_context(text, folded_text),
                 source_field=source_field,
             )
         )
 
-    return remove_duplicates_preserve_order(airway_techniques), findings
+    # Each technique is appended by exactly one branch, at most once, in a
+    # fixed order, so the list is already duplicate-free.
+    return airway_techniques, findings
+
+
+def extract_airway_management(
+    notes: str | None, source_field: str = "procedure_notes"
+) -> tuple[list[AirwayManagement], list[ExtractionFinding]]:
+    """
+    Extract airway management techniques with pattern matching and confidence scoring.
+
+    This function analyzes procedure notes to identify:
+    - Type of intubation (oral vs nasal ETT)
+    - Laryngoscopy technique (direct vs video)
+    - Alternative airways (LMA, mask ventilation)
+    - Special techniques (bronchoscopy)
+    - Difficult airway encounters
+
+    Args:
+        notes: Procedure notes text (can be None, NaN, or string)
+        source_field: Name of the field being analyzed (for tracking)
+
+    Returns:
+        Tuple of (airway_management_list, extraction_findings)
+        - airway_management_list: List of AirwayManagement enums found
+        - extraction_findings: List of ExtractionFinding objects with confidence scores
+
+    Example:
+        notes = "Patient intubated with video laryngoscopy"
+        techniques, findings = extract_airway_management(notes)
+        # techniques: [AirwayManagement.ORAL_ETT, AirwayManagement.VIDEO_LARYNGOSCOPE]
+    """
+    if pd.isna(notes):
+        return [], []
+
+    text = str(notes)
+    folded_text = fold_ascii(text)
+    if not _AIRWAY_SENTINEL.search(text, folded_text):
+        return [], []
+    hits = _AirwayHits(
+        *(pattern.search(text, folded_text) for _, pattern in _AIRWAY_HIT_PATTERNS)
+    )
+    return _build_airway_results(text, hits, source_field)
+
+
+def extract_airway_management_batch(
+    notes: pd.Series, source_field: str = "procedure_notes"
+) -> pd.DataFrame:
+    """
+    Extract airway management for a whole column of notes.
+
+    Pattern-group detection runs column-wise through ``batch_pattern_hits``
+    into a rows x groups boolean matrix, and findings are only built for rows
+    with a category hit. Each row equals ``extract_airway_management(note)``.
+
+    Args:
+        notes: Series of procedure notes (values may be None or NaN)
+        source_field: Name of the field being analyzed (for tracking)
+
+    Returns:
+        DataFrame indexed like ``notes`` with ``airway_management`` and
+        ``findings`` list columns.
+    """
+    text_values, hit_matrix = batch_pattern_hits(
+        notes, _AIRWAY_SENTINEL, [pattern for _, pattern in _AIRWAY_HIT_PATTERNS]
+    )
+    techniques: list[list[AirwayManagement]] = [[] for _ in range(len(notes))]
+    findings: list[list[ExtractionFinding]] = [[] for _ in range(len(notes))]
+    hit_rows = np.flatnonzero(hit_matrix[:, _AIRWAY_FINDING_COLUMNS].any(axis=1))
+    for row in hit_rows.tolist():
+        techniques[row], findings[row] = _build_airway_results(
+            text_values[row], _AirwayHits(*hit_matrix[row].tolist()), source_field
+        )
+
+    return pd.DataFrame(
+        {"airway_management": techniques, "findings": findings}, index=notes.index
+    )
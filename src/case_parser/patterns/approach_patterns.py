@@ -11,6 +11,8 @@ These patterns are used to subcategorize procedures like:
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
 from functools import lru_cache
 
 # Keywords indicating ENDOVASCULAR/PERCUTANEOUS approach
@@ -88,6 +90,30 @@ NONVASCULAR_PATHOLOGY_KEYWORDS = (
 )
 
 
+def _keyword_alternation(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile literal keywords into one alternation for uppercased text.
+
+    One ``search`` finds whether any keyword occurs as a substring, matching
+    ``any(keyword in text for keyword in keywords)`` in a single scan.
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Compiled once at import; the keyword tuples above stay the editable source.
+_ENDOVASCULAR_RE = _keyword_alternation(ENDOVASCULAR_KEYWORDS)
+_OPEN_RE = _keyword_alternation(OPEN_KEYWORDS)
+_CRANIAL_OPEN_RE = _keyword_alternation((
+    "CRANIOTOMY",
+    "CRANIECTOMY",
+    "BURR HOLE",
+    "CLIPPING",
+))
+_EXPLICIT_ENDOVASCULAR_RE = _keyword_alternation(("ENDOVASCULAR", "PERCUTANEOUS"))
+_VASCULAR_PATHOLOGY_RE = _keyword_alternation(VASCULAR_PATHOLOGY_KEYWORDS)
+_NONVASCULAR_PATHOLOGY_RE = _keyword_alternation(NONVASCULAR_PATHOLOGY_KEYWORDS)
+_HEMATOMA_VASCULAR_RE = _keyword_alternation(("ANEURYSM", "AVM", "ARTERIOVENOUS"))
+
+
 def detect_approach(procedure_text: str | None) -> str:
     """
     Detect surgical approach from procedure text.
@@ -110,18 +136,17 @@ def _detect_approach_cached(text_upper: str) -> str:  # noqa: PLR0911
         return "unknown"
 
     # Check for endovascular keywords
-    has_endovascular = any(keyword in text_upper for keyword in ENDOVASCULAR_KEYWORDS)
+    has_endovascular = _ENDOVASCULAR_RE.search(text_upper) is not None
 
     # Check for open keywords
-    has_open = any(keyword in text_upper for keyword in OPEN_KEYWORDS)
+    has_open = _OPEN_RE.search(text_upper) is not None
 
     # If both or neither are found, return unknown
     if has_endovascular and has_open:
-        cranial_open_terms = ("CRANIOTOMY", "CRANIECTOMY", "BURR HOLE", "CLIPPING")
-        if any(term in text_upper for term in cranial_open_terms):
+        if _CRANIAL_OPEN_RE.search(text_upper) is not None:
             return "open"
         # Both mentioned - prefer endovascular if explicitly stated
-        if "ENDOVASCULAR" in text_upper or "PERCUTANEOUS" in text_upper:
+        if _EXPLICIT_ENDOVASCULAR_RE.search(text_upper) is not None:
             return "endovascular"
         return "unknown"
 
@@ -156,12 +181,10 @@ def _detect_intracerebral_pathology_cached(text_upper: str) -> str:
         return "unknown"
 
     # Check for vascular pathology keywords
-    has_vascular = any(keyword in text_upper for keyword in VASCULAR_PATHOLOGY_KEYWORDS)
+    has_vascular = _VASCULAR_PATHOLOGY_RE.search(text_upper) is not None
 
     # Check for nonvascular pathology keywords
-    has_nonvascular = any(
-        keyword in text_upper for keyword in NONVASCULAR_PATHOLOGY_KEYWORDS
-    )
+    has_nonvascular = _NONVASCULAR_PATHOLOGY_RE.search(text_upper) is not None
 
     # If both or neither are found, return unknown
     if has_vascular and not has_nonvascular:
@@ -170,9 +193,7 @@ def _detect_intracerebral_pathology_cached(text_upper: str) -> str:
     if has_nonvascular and not has_vascular:
         return "nonvascular"
 
-    if "HEMATOMA" in text_upper and not any(
-        keyword in text_upper for keyword in ("ANEURYSM", "AVM", "ARTERIOVENOUS")
-    ):
+    if "HEMATOMA" in text_upper and _HEMATOMA_VASCULAR_RE.search(text_upper) is None:
         return "nonvascular"
 
     return "unknown"
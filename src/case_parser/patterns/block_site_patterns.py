@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Final
 
 PERIPHERAL_BLOCK_SITE_TERMS: tuple[str, ...] = (
@@ -156,24 +157,52 @@ def normalize_block_site_terms(
     their fixed term sets.
     """
     primary_text = _clean_optional_text(primary_block)
-    procedure_text = _clean_optional_text(procedure_name)
-    notes_text = _clean_optional_text(procedure_notes)
-    case_procedure_text = _clean_optional_text(case_procedure)
-
-    if not (primary_text or procedure_text or notes_text or case_procedure_text):
+    # Only use free-text notes as a supplement when a primary block value exists.
+    # This avoids matching anatomical words from unrelated surgical note text,
+    # and keeps unique notes out of the cache key for rows without a block.
+    matches = _match_clean_block_site_terms(
+        primary_text,
+        _clean_optional_text(procedure_name),
+        _clean_optional_text(procedure_notes) if primary_text else "",
+    )
+    if matches is None:
         return None
 
-    # Only use free-text notes as a supplement when a primary block value exists.
-    # This avoids matching anatomical words from unrelated surgical note text.
-    include_notes = bool(primary_text)
+    peripheral_matches, neuraxial_matches, brachial_plexus_context = matches
+    if brachial_plexus_context:
+        # The case procedure is only needed here, so it stays out of the cache key.
+        peripheral_matches = {
+            _infer_brachial_plexus_site(_clean_optional_text(case_procedure))
+        }
+
+    if not peripheral_matches and not neuraxial_matches:
+        return primary_text or None
+
+    ordered_terms = [
+        term for term in PERIPHERAL_BLOCK_SITE_TERMS if term in peripheral_matches
+    ]
+    ordered_terms.extend(
+        term for term in NEURAXIAL_BLOCK_SITE_TERMS if term in neuraxial_matches
+    )
+    return "; ".join(ordered_terms)
+
+
+@lru_cache(maxsize=32768)
+def _match_clean_block_site_terms(
+    primary_text: str,
+    procedure_text: str,
+    notes_text: str,
+) -> tuple[frozenset[str], frozenset[str], bool] | None:
+    """Cached pattern matching for normalize_block_site_terms() on cleaned text.
+
+    Most rows repeat a handful of block/anesthesia-type/procedure combinations,
+    so each distinct combination is pattern-matched once per process. Returns
+    the peripheral and neuraxial terms found, plus whether a generic brachial
+    plexus block still needs a site inferred from the case procedure. Returns
+    None when there is no text to search.
+    """
     search_text = " ".join(
-        part
-        for part in (
-            primary_text,
-            procedure_text,
-            notes_text if include_notes else "",
-        )
-        if part
+        part for part in (primary_text, procedure_text, notes_text) if part
     )
     if not search_text:
         return None
@@ -189,34 +218,24 @@ def normalize_block_site_terms(
     ):
         neuraxial_matches.add("Lumbar")
 
+    brachial_plexus_context = False
     if not peripheral_matches and _has_pattern_match(
         search_text, _PERIPHERAL_CONTEXT_PATTERNS
     ):
-        inferred_brachial_site = _infer_brachial_plexus_site(
-            search_text,
-            case_procedure_text,
-        )
-        peripheral_matches.add(inferred_brachial_site or _OTHER_PERIPHERAL_SITE)
-
-    if not peripheral_matches and not neuraxial_matches:
-        return primary_text or None
+        if _BRACHIAL_PLEXUS_CONTEXT.search(search_text):
+            brachial_plexus_context = True
+        else:
+            peripheral_matches.add(_OTHER_PERIPHERAL_SITE)
 
-    ordered_terms = [
-        term for term in PERIPHERAL_BLOCK_SITE_TERMS if term in peripheral_matches
-    ]
-    ordered_terms.extend(
-        term for term in NEURAXIAL_BLOCK_SITE_TERMS if term in neuraxial_matches
+    return (
+        frozenset(peripheral_matches),
+        frozenset(neuraxial_matches),
+        brachial_plexus_context,
     )
-    return "; ".join(ordered_terms)
 
 
-def _infer_brachial_plexus_site(
-    search_text: str, case_procedure_text: str
-) -> str | None:
+def _infer_brachial_plexus_site(case_procedure_text: str) -> str:
     """Infer a canonical site for generic brachial plexus block text."""
-    if not _BRACHIAL_PLEXUS_CONTEXT.search(search_text):
-        return None
-
     if _has_pattern_match(case_procedure_text, _BRACHIAL_PLEXUS_SHOULDER_PATTERNS):
         return "Interscalene"
 
@@ -9,15 +9,19 @@ function that encapsulates the specific rules for that type.
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
-from functools import lru_cache
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache, partial
 from itertools import starmap
 from numbers import Real
+from types import MappingProxyType
 
 import pandas as pd
 
 from ..domain import ProcedureCategory
-from .approach_patterns import detect_approach, detect_intracerebral_pathology
+from .approach_patterns import (
+    _detect_approach_cached,
+    _detect_intracerebral_pathology_cached,
+)
 from .procedure_patterns import (
     DEFAULT_PROCEDURE_CATEGORY,
     OBGYN_SERVICE_KEYWORDS,
@@ -30,6 +34,11 @@ _SERVICE_SENTINELS = {"", "<NA>", "NAN", "NONE"}
 _CESAREAN_KEYWORDS = ("CESAREAN", "C-SECTION", "C SECTION")
 _OB_DELIVERY_KEYWORDS = ("VAGINAL", "DELIVERY", "LABOR")
 _OB_GENERIC_NEURAXIAL_KEYWORDS = ("EPIDURAL", "CSE")
+# Rule categories that map directly to one ProcedureCategory.
+_STANDARD_RULE_CATEGORIES: Mapping[str, ProcedureCategory] = MappingProxyType({
+    "Intrathoracic non-cardiac": ProcedureCategory.INTRATHORACIC_NON_CARDIAC,
+    "Other (procedure cat)": ProcedureCategory.OTHER,
+})
 
 
 def categorize_cardiac(procedure_text: str) -> ProcedureCategory:
@@ -110,13 +119,17 @@ def categorize_vascular(procedure_text: str) -> ProcedureCategory:
     - Open: Traditional open surgical repair
 
     Args:
-        procedure_text: Procedure description
+        procedure_text: Uppercase procedure description
 
     Returns:
         ProcedureCategory for vascular subtype
     """
-    approach = detect_approach(procedure_text)
-    if approach == "endovascular":
+    return _categorize_vascular_text(str(procedure_text).upper())
+
+
+def _categorize_vascular_text(text_upper: str) -> ProcedureCategory:
+    """Return the major vessel category for already-uppercased procedure text."""
+    if _detect_approach_cached(text_upper) == "endovascular":
         return ProcedureCategory.MAJOR_VESSELS_ENDOVASCULAR
     return ProcedureCategory.MAJOR_VESSELS_OPEN
 
@@ -130,18 +143,23 @@ def categorize_intracerebral(procedure_text: str) -> ProcedureCategory:
     2. Pathology (for open): vascular vs nonvascular
 
     Args:
-        procedure_text: Procedure description
+        procedure_text: Uppercase procedure description
 
     Returns:
         ProcedureCategory for intracerebral subtype
     """
-    approach = detect_approach(procedure_text)
+    return _categorize_intracerebral_text(str(procedure_text).upper())
+
+
+def _categorize_intracerebral_text(text_upper: str) -> ProcedureCategory:
+    """Return the intracerebral category for already-uppercased procedure text."""
+    approach = _detect_approach_cached(text_upper)
 
     if approach == "endovascular":
         return ProcedureCategory.INTRACEREBRAL_ENDOVASCULAR
 
     if approach == "open":
-        pathology = detect_intracerebral_pathology(procedure_text)
+        pathology = _detect_intracerebral_pathology_cached(text_upper)
         if pathology == "vascular":
             return ProcedureCategory.INTRACEREBRAL_VASCULAR_OPEN
         if pathology == "nonvascular":
@@ -190,19 +208,40 @@ def categorize_obgyn(procedure_text: str) -> ProcedureCategory:
     return _categorize_obgyn_text(procedure_text)
 
 
+def _rules_with_keyword_hits(
+    rules: Sequence[ProcedureRule], value: str
+) -> Iterator[ProcedureRule]:
+    """Yield, in priority order, the rules with a keyword found in ``value``."""
+    return (
+        rule for rule in rules if any(keyword in value for keyword in rule.keywords)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _service_rules_with_keyword_hits(service: str) -> tuple[ProcedureRule, ...]:
+    """Return PROCEDURE_RULES entries with a keyword in one normalized service.
+
+    Services come from a short controlled list while procedure text is nearly
+    unique per case, so caching here scans each service's keywords once.
+    """
+    return tuple(_rules_with_keyword_hits(PROCEDURE_RULES, service))
+
+
 def _match_rules(
     values: list[str],
     procedure_text: str,
-    rules: list[ProcedureRule],
+    rule_hits: Callable[[str], Iterable[ProcedureRule]],
     *,
     exclude_in_values: bool,
 ) -> list[ProcedureCategory]:
-    """Return ordered unique categories matched by a set of ProcedureRule values."""
+    """Return ordered unique categories matched by a set of ProcedureRule values.
+
+    ``rule_hits`` yields, in priority order, the rules whose keywords occur in
+    a value; the first one not vetoed by an exclude keyword wins.
+    """
     categories: list[ProcedureCategory] = []
     for value in values:
-        for rule in rules:
-            if not any(keyword in value for keyword in rule.keywords):
-                continue
+        for rule in rule_hits(value):
             if rule.exclude_keywords and any(
                 excl in procedure_text or (exclude_in_values and excl in value)
                 for excl in rule.exclude_keywords
@@ -230,7 +269,7 @@ def _match_services_to_categories(
     categories = _match_rules(
         services,
         procedure_text,
-        PROCEDURE_RULES,
+        _service_rules_with_keyword_hits,
         exclude_in_values=True,
     )
 
@@ -266,7 +305,7 @@ def _fallback_categories_from_text(procedure_text: str) -> list[ProcedureCategor
     categories = _match_rules(
         [procedure_text],
         procedure_text,
-        PROCEDURE_TEXT_RULES,
+        partial(_rules_with_keyword_hits, PROCEDURE_TEXT_RULES),
         exclude_in_values=False,
     )
     if categories:
@@ -440,15 +479,13 @@ def _apply_rule_category(rule_category: str, procedure_text: str) -> ProcedureCa
     if rule_category == "Cardiac":
         return categorize_cardiac(procedure_text)
 
+    # procedure_text is already uppercased once per row, so call the uppercase
+    # helpers directly instead of re-normalizing through the public functions.
     if rule_category == "Procedures Major Vessels":
-        return categorize_vascular(procedure_text)
+        return _categorize_vascular_text(procedure_text)
 
     if rule_category == "Intracerebral":
-        return categorize_intracerebral(procedure_text)
+        return _categorize_intracerebral_text(procedure_text)
 
     # Standard category mapping
-    category_map = {
-        "Intrathoracic non-cardiac": ProcedureCategory.INTRATHORACIC_NON_CARDIAC,
-        "Other (procedure cat)": ProcedureCategory.OTHER,
-    }
-    return category_map.get(rule_category, ProcedureCategory.OTHER)
+    return _STANDARD_RULE_CATEGORIES.get(rule_category, ProcedureCategory.OTHER)
@@ -8,8 +8,14 @@ These utilities handle pattern matching, confidence scoring, and context extract
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from functools import cache
 
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
 PatternLike = str | re.Pattern[str]
 
 
@@ -26,8 +32,316 @@ def _coerce_pattern(pattern: PatternLike) -> re.Pattern[str]:
     return _compile_ignore_case(pattern)
 
 
+# Match counts at or above this no longer move confidence_from_counts(): the
+# supporting bonus tops out at four hits and four negation cues (-1.2) clamp
+# any score to 0.0, so counting can stop there.
+SATURATED_MATCH_COUNT = 4
+
+
+def count_matching_patterns(
+    text: str, patterns: Sequence[PatternLike], limit: int | None = None
+) -> int:
+    """Count the patterns that match anywhere in ``text``, stopping at ``limit``.
+
+    The per-pattern searches exit as soon as ``limit`` patterns have matched,
+    so callers that only need a capped count skip the remaining scans.
+
+    Args:
+        text: Text to search in
+        patterns: Regex patterns to test
+        limit: Highest count the caller distinguishes; None counts every hit
+
+    Returns:
+        Number of matching patterns, at most ``limit``.
+    """
+    count = 0
+    for pattern in compile_patterns(patterns):
+        if pattern.search(text):
+            count += 1
+            if count == limit:
+                break
+    return count
+
+
+def compile_patterns(patterns: Iterable[PatternLike]) -> tuple[re.Pattern[str], ...]:
+    """Compile pattern strings case-insensitively for reuse on hot paths.
+
+    Args:
+        patterns: Regex strings or already compiled patterns.
+
+    Returns:
+        Tuple of compiled patterns in input order.
+    """
+    return tuple(_coerce_pattern(pattern) for pattern in patterns)
+
+
+def compile_alternation(patterns: Iterable[str]) -> re.Pattern[str]:
+    """Fuse pattern strings into one case-insensitive alternation.
+
+    A single ``search`` on the fused pattern answers "does any pattern match"
+    in one pass over the text instead of one pass per pattern.
+
+    Args:
+        patterns: Regex strings to combine.
+
+    Returns:
+        Compiled ``(?:p1)|(?:p2)|...`` pattern.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+_ESCAPE_RE = re.compile(r"(\\.)", re.DOTALL)
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """Lowercase a regex's literal characters, leaving escapes like ``\\S`` intact."""
+    return "".join(
+        part if part.startswith("\\") else part.lower()
+        for part in _ESCAPE_RE.split(pattern)
+    )
+
+
+def fold_ascii(text: str) -> str | None:
+    """Lowercase ``text`` for :class:`FoldedAlternation` searches.
+
+    Returns None for non-ASCII text, where ``str.lower`` and the case folding
+    of ``re.IGNORECASE`` can disagree (for example U+017F folds onto "s").
+    """
+    return text.lower() if text.isascii() else None
+
+
+@dataclass(frozen=True, slots=True)
+class FoldedAlternation:
+    """Case-insensitive alternation with a fast path for lowercased ASCII text.
+
+    ``re.IGNORECASE`` folds case on every comparison and disables the literal
+    prefix scans ``re`` otherwise uses. Searching text lowercased once with
+    lowercased, case-sensitive patterns gives the same answer for ASCII text.
+    The member patterns are kept alongside for per-pattern lookups.
+    """
+
+    ignore_case: re.Pattern[str]
+    folded: re.Pattern[str]
+    members: tuple[re.Pattern[str], ...]
+    folded_members: tuple[re.Pattern[str], ...]
+
+    @classmethod
+    def compile(cls, patterns: Iterable[str]) -> FoldedAlternation:
+        """Fuse pattern strings into both forms of one alternation.
+
+        Args:
+            patterns: Regex strings, matched case-insensitively.
+
+        Returns:
+            The compiled alternation pair and its member patterns.
+        """
+        patterns = list(patterns)
+        folded_patterns = [_lowercase_pattern(pattern) for pattern in patterns]
+        return cls(
+            ignore_case=compile_alternation(patterns),
+            folded=re.compile(
+                "|".join(f"(?:{pattern})" for pattern in folded_patterns)
+            ),
+            members=compile_patterns(patterns),
+            folded_members=tuple(re.compile(pattern) for pattern in folded_patterns),
+        )
+
+    def search(self, text: str, folded_text: str | None) -> bool:
+        """Return True when any pattern matches ``text``.
+
+        Args:
+            text: Text to search in
+            folded_text: ``fold_ascii(text)``, computed once per text
+
+        Returns:
+            Whether the alternation matches.
+        """
+        if folded_text is None:
+            return self.ignore_case.search(text) is not None
+        return self.folded.search(folded_text) is not None
+
+    def first_match_context(
+        self, text: str, folded_text: str | None, context_window: int = 50
+    ) -> str | None:
+        """Return ``first_match_context(text, patterns)`` after one fused search.
+
+        No member can match left of the leftmost fused match, and the member
+        that produced it matches right there. Searching members in order from
+        that offset therefore finds the first listed pattern's first match
+        without rescanning the text before it, and misses cost a single pass.
+
+        Args:
+            text: Text to search in
+            folded_text: ``fold_ascii(text)``, computed once per text
+            context_window: Number of characters before/after match to include
+
+        Returns:
+            Context string, or None when no pattern matches.
+        """
+        if folded_text is None:
+            haystack, fused, members = text, self.ignore_case, self.members
+        else:
+            haystack, fused, members = folded_text, self.folded, self.folded_members
+        leftmost = fused.search(haystack)
+        if leftmost is None:
+            return None
+        for member in members:
+            match = member.search(haystack, leftmost.start())
+            if match is not None:
+                # ASCII lowercasing keeps offsets, so spans index the original.
+                start = max(0, match.start() - context_window)
+                end = min(len(text), match.end() + context_window)
+                return text[start:end].strip()
+        return None
+
+
+def _longest_required_literal(pattern: str) -> str | None:
+    """Return the longest ASCII literal run every match of ``pattern`` contains.
+
+    Only top-level literals are required; text inside groups, alternations,
+    classes or quantified atoms may be skipped by a match and is ignored.
+    Returns None, meaning no prefilter, when the pattern cannot be analyzed.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    # re._parser is private CPython API; its (op, value) layout was checked on
+    # CPython 3.13. Any import or layout change only disables the prefilter,
+    # since this runs at import time for the extractor modules.
+    try:
+        from re import _constants as sre_constants  # noqa: PLC0415, PLC2701
+        from re import _parser as sre_parser  # noqa: PLC0415, PLC2701
+
+        for op, value in sre_parser.parse(pattern):
+            if op is sre_constants.LITERAL and value < 128:
+                current.append(chr(value))
+                continue
+            if current:
+                runs.append("".join(current))
+                current = []
+    except (ImportError, AttributeError, TypeError, ValueError, re.error):
+        return None
+    if current:
+        runs.append("".join(current))
+    return max(runs, key=len).lower() if runs else None
+
+
+def required_literals(patterns: Iterable[str]) -> tuple[str, ...] | None:
+    """Lowercase literals of which any match of any pattern contains one.
+
+    Literals that contain another literal in the set are dropped, since the
+    shorter one is present whenever the longer one is.
+
+    Args:
+        patterns: Regex strings, matched case-insensitively.
+
+    Returns:
+        Tuple of literals, or None when some pattern has no required literal
+        and the set therefore cannot rule out a match.
+    """
+    literals = set()
+    for pattern in patterns:
+        literal = _longest_required_literal(pattern)
+        if literal is None:
+            return None
+        literals.add(literal)
+    return tuple(
+        sorted(
+            literal
+            for literal in literals
+            if not any(other != literal and other in literal for other in literals)
+        )
+    )
+
+
+def may_contain_match(
+    folded_text: str | None, literals: tuple[str, ...] | None
+) -> bool:
+    """Return False only when the text cannot match the patterns behind ``literals``.
+
+    A substring scan per literal is much cheaper than entering the regex
+    engine. Non-ASCII text (``folded_text`` is None) always passes, because
+    case-insensitive regexes fold some non-ASCII characters onto ASCII letters
+    that ``str.lower`` leaves alone.
+
+    Args:
+        folded_text: ``fold_ascii(text)`` for the text about to be searched
+        literals: Result of :func:`required_literals`
+
+    Returns:
+        True when a regex search is still needed.
+    """
+    if literals is None or folded_text is None:
+        return True
+    return any(literal in folded_text for literal in literals)
+
+
+def batch_pattern_hits(
+    notes: pd.Series,
+    sentinel: FoldedAlternation,
+    patterns: Sequence[FoldedAlternation],
+    literals: tuple[str, ...] | None = None,
+) -> tuple[list[str | None], NDArray[np.bool_]]:
+    """Match a column of notes against several fused patterns at once.
+
+    Each note is folded once; ``sentinel`` is searched first and ``patterns``
+    only on the rows it matched, so rows without any candidate text cost a
+    single pass. Scanning one concatenated buffer and mapping match offsets
+    back to rows was measured slower: ``finditer`` has to visit every match,
+    while ``search`` stops at the first hit in each row.
+
+    Args:
+        notes: Series of note values (values may be None or NaN)
+        sentinel: Alternation that matches whenever any of ``patterns`` does
+        patterns: Alternations to test, one matrix column each
+        literals: Optional :func:`required_literals` of the sentinel; rows
+            that cannot contain any of them skip the sentinel search
+
+    Returns:
+        Tuple of (texts, hit_matrix) where ``texts`` holds each note as a
+        string (None when missing) and ``hit_matrix`` is a rows x patterns
+        boolean array.
+    """
+    texts = [None if pd.isna(value) else str(value) for value in notes]
+    hit_matrix = np.zeros((len(texts), len(patterns)), dtype=bool)
+    for row, text in enumerate(texts):
+        if text is None:
+            continue
+        folded_text = fold_ascii(text)
+        if not may_contain_match(folded_text, literals) or not sentinel.search(
+            text, folded_text
+        ):
+            continue
+        hit_matrix[row] = [pattern.search(text, folded_text) for pattern in patterns]
+    return texts, hit_matrix
+
+
+def first_match_context(
+    text: str, patterns: Sequence[PatternLike], context_window: int = 50
+) -> str | None:
+    """Return the context of the first match of the first matching pattern.
+
+    Equivalent to ``extract_with_context(text, patterns)[0][1]`` but stops at
+    the first hit instead of collecting every match of every pattern.
+
+    Args:
+        text: Text to search in
+        patterns: Regex patterns tried in order
+        context_window: Number of characters before/after match to include
+
+    Returns:
+        Context string, or None when no pattern matches.
+    """
+    for pattern in patterns:
+        match = _coerce_pattern(pattern).search(text)
+        if match is not None:
+            start = max(0, match.start() - context_window)
+            end = min(len(text), match.end() + context_window)
+            return text[start:end].strip()
+    return None
+
+
 def extract_with_context(
-    text: str, patterns: list[PatternLike], context_window: int = 50
+    text: str, patterns: Sequence[PatternLike], context_window: int = 50
 ) -> list[tuple[str, str, int]]:
     r"""
     Extract matches with surrounding context.
@@ -47,8 +361,7 @@ def extract_with_context(
         # Returns: [("arterial line", "had arterial line placed", 12)]
     """
     findings = []
-    for pattern in patterns:
-        compiled_pattern = _coerce_pattern(pattern)
+    for compiled_pattern in compile_patterns(patterns):
         for match in compiled_pattern.finditer(text):
             start = max(0, match.start() - context_window)
             end = min(len(text), match.end() + context_window)
@@ -59,9 +372,9 @@ def extract_with_context(
 
 def calculate_pattern_confidence(
     text: str,
-    primary_patterns: list[PatternLike],
-    supporting_patterns: list[PatternLike] | None = None,
-    negation_patterns: list[PatternLike] | None = None,
+    primary_patterns: Sequence[PatternLike],
+    supporting_patterns: Sequence[PatternLike] | None = None,
+    negation_patterns: Sequence[PatternLike] | None = None,
 ) -> float:
     r"""
     Calculate confidence score based on pattern matches.
@@ -90,25 +403,39 @@ def calculate_pattern_confidence(
     if not primary_patterns:
         return 0.0
 
-    if not any(_coerce_pattern(pattern).search(text) for pattern in primary_patterns):
+    if not count_matching_patterns(text, primary_patterns, limit=1):
         return 0.0
 
-    confidence = 0.5
+    supporting_matches = (
+        count_matching_patterns(text, supporting_patterns, SATURATED_MATCH_COUNT)
+        if supporting_patterns
+        else 0
+    )
+    negation_matches = (
+        count_matching_patterns(text, negation_patterns, SATURATED_MATCH_COUNT)
+        if negation_patterns
+        else 0
+    )
+    return confidence_from_counts(supporting_matches, negation_matches)
 
-    if supporting_patterns:
-        supporting_matches = sum(
-            1
-            for pattern in supporting_patterns
-            if _coerce_pattern(pattern).search(text)
-        )
-        confidence += min(supporting_matches * 0.1, 0.4)
 
-    if negation_patterns:
-        negation_matches = sum(
-            1 for pattern in negation_patterns if _coerce_pattern(pattern).search(text)
-        )
-        confidence -= negation_matches * 0.3
+def confidence_from_counts(supporting_matches: int, negation_matches: int) -> float:
+    """
+    Score a primary match from precomputed supporting/negation match counts.
 
+    Applies the same formula as :func:`calculate_pattern_confidence` for text
+    whose primary pattern is already known to match, so callers that score
+    several findings on one note can count each pattern group once.
+
+    Args:
+        supporting_matches: Number of supporting patterns that matched
+        negation_matches: Number of negation patterns that matched
+
+    Returns:
+        Confidence score between 0.0 and 1.0
+    """
+    confidence = 0.5 + min(supporting_matches * 0.1, 0.4)
+    confidence -= negation_matches * 0.3
     return max(0.0, min(1.0, confidence))
 
 
@@ -127,10 +454,5 @@ def remove_duplicates_preserve_order(items: list) -> list:
         remove_duplicates_preserve_order(items)
         # Returns: ["ETT", "DL", "VL"]
     """
-    seen = set()
-    unique = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            unique.append(item)
-    return unique
+    # dict keys keep insertion order, so this dedupes in one C-level pass.
+    return list(dict.fromkeys(items))
@@ -23,13 +23,21 @@ EXAMPLES OF MATCHED TEXT:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 from ..domain import ExtractionFinding, MonitoringTechnique
 from .extraction_utils import (
-    calculate_pattern_confidence,
-    extract_with_context,
+    FoldedAlternation,
+    batch_pattern_hits,
+    confidence_from_counts,
+    fold_ascii,
+    may_contain_match,
     remove_duplicates_preserve_order,
+    required_literals,
 )
 
 # ============================================================================
@@ -77,12 +85,79 @@ INVASIVE_NEURO_PATTERNS = [
     r"\bEVD\b",  # External Ventricular Drain
 ]
 
+# Compiled once at import; the lists above stay the editable source of truth.
+# Union of every category; notes missing it skip the per-category searches.
+_MONITORING_PATTERNS = [
+    *TEE_PATTERNS,
+    *ELECTROPHYSIOLOGIC_PATTERNS,
+    *CSF_DRAIN_PATTERNS,
+    *INVASIVE_NEURO_PATTERNS,
+]
+_MONITORING_SENTINEL = FoldedAlternation.compile(_MONITORING_PATTERNS)
+# Lowercase literals every sentinel match contains; ASCII notes holding none of
+# them skip the regex engine entirely.
+_MONITORING_LITERALS = required_literals(_MONITORING_PATTERNS)
+# One fused alternation per category finds the first-match context in a single
+# pass, or None when the category is absent. Each row also carries the finding
+# value so the per-note loop skips the enum lookup.
+_MONITORING_CATEGORIES = (
+    (
+        MonitoringTechnique.TEE,
+        MonitoringTechnique.TEE.value,
+        FoldedAlternation.compile(TEE_PATTERNS),
+    ),
+    (
+        MonitoringTechnique.ELECTROPHYSIOLOGIC_MON,
+        MonitoringTechnique.ELECTROPHYSIOLOGIC_MON.value,
+        FoldedAlternation.compile(ELECTROPHYSIOLOGIC_PATTERNS),
+    ),
+    (
+        MonitoringTechnique.CSF_DRAIN,
+        MonitoringTechnique.CSF_DRAIN.value,
+        FoldedAlternation.compile(CSF_DRAIN_PATTERNS),
+    ),
+    (
+        MonitoringTechnique.INVASIVE_NEURO_MON,
+        MonitoringTechnique.INVASIVE_NEURO_MON.value,
+        FoldedAlternation.compile(INVASIVE_NEURO_PATTERNS),
+    ),
+)
+
 
 # ============================================================================
 # EXTRACTION FUNCTION
 # ============================================================================
 
 
+def _build_monitoring_results(
+    contexts: Sequence[str | None], source_field: str
+) -> tuple[list[MonitoringTechnique], list[ExtractionFinding]]:
+    """Build techniques and findings from each category's first-match context.
+
+    ``contexts`` lines up with ``_MONITORING_CATEGORIES``; None marks a category
+    with no match. Monitoring findings carry no supporting or negation
+    patterns, so every hit scores the base confidence.
+    """
+    monitoring = []
+    findings = []
+    for (technique, value, _), context in zip(
+        _MONITORING_CATEGORIES, contexts, strict=True
+    ):
+        if context is None:
+            continue
+        monitoring.append(technique)
+        findings.append(
+            ExtractionFinding(
+                value=value,
+                confidence=confidence_from_counts(0, 0),
+                context=context,
+                source_field=source_field,
+            )
+        )
+
+    return remove_duplicates_preserve_order(monitoring), findings
+
+
 def extract_monitoring(
     notes: str | None, source_field: str = "procedure_notes"
 ) -> tuple[list[MonitoringTechnique], list[ExtractionFinding]]:
@@ -113,64 +188,72 @@ def extract_monitoring(
     if notes is None or (isinstance(notes, float) and pd.isna(notes)):
         return [], []
 
-    text = str(notes)
-    monitoring = []
-    findings = []
+    values, findings = _extract_monitoring_cached(str(notes), source_field)
+    return list(values), list(findings)
 
-    # TEE
-    tee_matches = extract_with_context(text, TEE_PATTERNS)
-    if tee_matches:
-        monitoring.append(MonitoringTechnique.TEE)
-        confidence = calculate_pattern_confidence(text, TEE_PATTERNS)
-        findings.append(
-            ExtractionFinding(
-                value=MonitoringTechnique.TEE.value,
-                confidence=confidence,
-                context=tee_matches[0][1],
-                source_field=source_field,
-            )
-        )
 
-    # Electrophysiologic monitoring
-    ep_matches = extract_with_context(text, ELECTROPHYSIOLOGIC_PATTERNS)
-    if ep_matches:
-        monitoring.append(MonitoringTechnique.ELECTROPHYSIOLOGIC_MON)
-        confidence = calculate_pattern_confidence(text, ELECTROPHYSIOLOGIC_PATTERNS)
-        findings.append(
-            ExtractionFinding(
-                value=MonitoringTechnique.ELECTROPHYSIOLOGIC_MON.value,
-                confidence=confidence,
-                context=ep_matches[0][1],
-                source_field=source_field,
-            )
-        )
+@lru_cache(maxsize=32768)
+def _extract_monitoring_cached(
+    text: str, source_field: str
+) -> tuple[tuple[MonitoringTechnique, ...], tuple[ExtractionFinding, ...]]:
+    """Cached core of extract_monitoring() for a non-missing note.
 
-    # CSF drain
-    csf_matches = extract_with_context(text, CSF_DRAIN_PATTERNS)
-    if csf_matches:
-        monitoring.append(MonitoringTechnique.CSF_DRAIN)
-        confidence = calculate_pattern_confidence(text, CSF_DRAIN_PATTERNS)
-        findings.append(
-            ExtractionFinding(
-                value=MonitoringTechnique.CSF_DRAIN.value,
-                confidence=confidence,
-                context=csf_matches[0][1],
-                source_field=source_field,
-            )
-        )
+    Templated dictation repeats verbatim across cases, so repeated notes
+    resolve with one cache lookup. Results are tuples of frozen findings,
+    safe to share between callers.
+    """
+    folded_text = fold_ascii(text)
+    if not may_contain_match(
+        folded_text, _MONITORING_LITERALS
+    ) or not _MONITORING_SENTINEL.search(text, folded_text):
+        return (), ()
+    contexts = [
+        any_pattern.first_match_context(text, folded_text)
+        for _, _, any_pattern in _MONITORING_CATEGORIES
+    ]
+    values, findings = _build_monitoring_results(contexts, source_field)
+    return tuple(values), tuple(findings)
 
-    # Invasive neuro monitoring
-    neuro_matches = extract_with_context(text, INVASIVE_NEURO_PATTERNS)
-    if neuro_matches:
-        monitoring.append(MonitoringTechnique.INVASIVE_NEURO_MON)
-        confidence = calculate_pattern_confidence(text, INVASIVE_NEURO_PATTERNS)
-        findings.append(
-            ExtractionFinding(
-                value=MonitoringTechnique.INVASIVE_NEURO_MON.value,
-                confidence=confidence,
-                context=neuro_matches[0][1],
-                source_field=source_field,
+
+def extract_monitoring_batch(
+    notes: pd.Series, source_field: str = "procedure_notes"
+) -> pd.DataFrame:
+    """
+    Extract monitoring techniques for a whole column of notes.
+
+    Category detection runs column-wise through ``batch_pattern_hits`` and
+    findings are only built for rows with a category hit. Each row equals
+    ``extract_monitoring(note)``.
+
+    Args:
+        notes: Series of procedure notes (values may be None or NaN)
+        source_field: Name of the field being analyzed (for tracking)
+
+    Returns:
+        DataFrame indexed like ``notes`` with ``monitoring`` and ``findings``
+        list columns.
+    """
+    text_values, hit_matrix = batch_pattern_hits(
+        notes,
+        _MONITORING_SENTINEL,
+        [any_pattern for _, _, any_pattern in _MONITORING_CATEGORIES],
+        _MONITORING_LITERALS,
+    )
+    monitoring: list[list[MonitoringTechnique]] = [[] for _ in range(len(notes))]
+    findings: list[list[ExtractionFinding]] = [[] for _ in range(len(notes))]
+    for row in np.flatnonzero(hit_matrix.any(axis=1)).tolist():
+        text = text_values[row]
+        folded_text = fold_ascii(text)
+        contexts = [
+            any_pattern.first_match_context(text, folded_text) if hit else None
+            for (_, _, any_pattern), hit in zip(
+                _MONITORING_CATEGORIES, hit_matrix[row].tolist(), strict=True
             )
+        ]
+        monitoring[row], findings[row] = _build_monitoring_results(
+            contexts, source_field
         )
 
-    return remove_duplicates_preserve_order(monitoring), findings
+    return pd.DataFrame(
+        {"monitoring": monitoring, "findings": findings}, index=notes.index
+    )
@@ -22,14 +22,24 @@ EXAMPLES OF MATCHED TEXT:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 from ..domain import ExtractionFinding, VascularAccess
 from .airway_patterns import NEGATION_PATTERNS
 from .extraction_utils import (
-    calculate_pattern_confidence,
-    extract_with_context,
+    SATURATED_MATCH_COUNT,
+    FoldedAlternation,
+    batch_pattern_hits,
+    confidence_from_counts,
+    count_matching_patterns,
+    fold_ascii,
+    may_contain_match,
     remove_duplicates_preserve_order,
+    required_literals,
 )
 
 # ============================================================================
@@ -71,12 +81,108 @@ PA_CATHETER_PATTERNS = [
     r"\bPAC\b",
 ]
 
+# Compiled once at import; the lists above stay the editable source of truth.
+# One fused alternation per category finds the first-match context in a single
+# pass; its member patterns serve the supporting/negation counts, which are
+# per pattern.
+_ARTERIAL_LINE_ANY = FoldedAlternation.compile(ARTERIAL_LINE_PATTERNS)
+_CENTRAL_LINE_ANY = FoldedAlternation.compile(CENTRAL_LINE_PATTERNS)
+_PA_CATHETER_ANY = FoldedAlternation.compile(PA_CATHETER_PATTERNS)
+_NEGATION_ANY = FoldedAlternation.compile(NEGATION_PATTERNS)
+# Category table shared by the per-note and batch extractors: technique and
+# its finding value, fused alternation, whether negation cues lower the
+# confidence, and the index of the category whose hits support this one.
+_VASCULAR_CATEGORIES = (
+    (
+        VascularAccess.ARTERIAL_CATHETER,
+        VascularAccess.ARTERIAL_CATHETER.value,
+        _ARTERIAL_LINE_ANY,
+        True,
+        None,
+    ),
+    (
+        VascularAccess.CENTRAL_VENOUS_CATHETER,
+        VascularAccess.CENTRAL_VENOUS_CATHETER.value,
+        _CENTRAL_LINE_ANY,
+        True,
+        None,
+    ),
+    # Central line mentions support a PA catheter finding.
+    (
+        VascularAccess.PULMONARY_ARTERY_CATHETER,
+        VascularAccess.PULMONARY_ARTERY_CATHETER.value,
+        _PA_CATHETER_ANY,
+        False,
+        1,
+    ),
+)
+_VASCULAR_CATEGORY_PATTERNS = tuple(category[2] for category in _VASCULAR_CATEGORIES)
+# Union of every category; notes missing it skip the per-category searches.
+_VASCULAR_PATTERNS = [
+    *ARTERIAL_LINE_PATTERNS,
+    *CENTRAL_LINE_PATTERNS,
+    *PA_CATHETER_PATTERNS,
+]
+_VASCULAR_SENTINEL = FoldedAlternation.compile(_VASCULAR_PATTERNS)
+# Lowercase literals every sentinel match contains; ASCII notes holding none of
+# them skip the regex engine entirely.
+_VASCULAR_LITERALS = required_literals(_VASCULAR_PATTERNS)
+
 
 # ============================================================================
 # EXTRACTION FUNCTION
 # ============================================================================
 
 
+def _build_vascular_results(
+    text: str, contexts: Sequence[str | None], source_field: str
+) -> tuple[list[VascularAccess], list[ExtractionFinding]]:
+    """Build access types and findings from each category's first-match context.
+
+    ``contexts`` lines up with ``_VASCULAR_CATEGORIES``; None marks a category
+    with no match. Negation cues are counted at most once per note and shared
+    by every category that uses them.
+    """
+    vascular = []
+    findings = []
+    negation_matches = None
+    categories = zip(_VASCULAR_CATEGORIES, contexts, strict=True)
+    for (technique, value, _, negated, supported_by), context in categories:
+        if context is None:
+            continue
+        negative = 0
+        if negated:
+            if negation_matches is None:
+                negation_matches = (
+                    count_matching_patterns(
+                        text, _NEGATION_ANY.members, SATURATED_MATCH_COUNT
+                    )
+                    if _NEGATION_ANY.search(text, fold_ascii(text))
+                    else 0
+                )
+            negative = negation_matches
+        supporting = (
+            count_matching_patterns(
+                text,
+                _VASCULAR_CATEGORIES[supported_by][2].members,
+                SATURATED_MATCH_COUNT,
+            )
+            if supported_by is not None and contexts[supported_by] is not None
+            else 0
+        )
+        vascular.append(technique)
+        findings.append(
+            ExtractionFinding(
+                value=value,
+                confidence=confidence_from_counts(supporting, negative),
+                context=context,
+                source_field=source_field,
+            )
+        )
+
+    return remove_duplicates_preserve_order(vascular), findings
+
+
 def extract_vascular_access(
     notes: str | None, source_field: str = "procedure_notes"
 ) -> tuple[list[VascularAccess], list[ExtractionFinding]]:
@@ -106,56 +212,64 @@ def extract_vascular_access(
     if pd.isna(notes):
         return [], []
 
-    text = str(notes)
-    vascular = []
-    findings = []
+    values, findings = _extract_vascular_access_cached(str(notes), source_field)
+    return list(values), list(findings)
 
-    # Arterial line
-    art_matches = extract_with_context(text, ARTERIAL_LINE_PATTERNS)
-    if art_matches:
-        vascular.append(VascularAccess.ARTERIAL_CATHETER)
-        confidence = calculate_pattern_confidence(
-            text, ARTERIAL_LINE_PATTERNS, None, NEGATION_PATTERNS
-        )
-        findings.append(
-            ExtractionFinding(
-                value=VascularAccess.ARTERIAL_CATHETER.value,
-                confidence=confidence,
-                context=art_matches[0][1],
-                source_field=source_field,
-            )
-        )
 
-    # Central venous catheter
-    cvc_matches = extract_with_context(text, CENTRAL_LINE_PATTERNS)
-    if cvc_matches:
-        vascular.append(VascularAccess.CENTRAL_VENOUS_CATHETER)
-        confidence = calculate_pattern_confidence(
-            text, CENTRAL_LINE_PATTERNS, None, NEGATION_PATTERNS
-        )
-        findings.append(
-            ExtractionFinding(
-                value=VascularAccess.CENTRAL_VENOUS_CATHETER.value,
-                confidence=confidence,
-                context=cvc_matches[0][1],
-                source_field=source_field,
-            )
-        )
+@lru_cache(maxsize=32768)
+def _extract_vascular_access_cached(
+    text: str, source_field: str
+) -> tuple[tuple[VascularAccess, ...], tuple[ExtractionFinding, ...]]:
+    """Cached implementation of extract_vascular_access() for a present note."""
+    folded_text = fold_ascii(text)
+    if not may_contain_match(
+        folded_text, _VASCULAR_LITERALS
+    ) or not _VASCULAR_SENTINEL.search(text, folded_text):
+        return (), ()
+    contexts = [
+        pattern.first_match_context(text, folded_text)
+        for pattern in _VASCULAR_CATEGORY_PATTERNS
+    ]
+    values, findings = _build_vascular_results(text, contexts, source_field)
+    return tuple(values), tuple(findings)
 
-    # PA catheter
-    pa_matches = extract_with_context(text, PA_CATHETER_PATTERNS)
-    if pa_matches:
-        vascular.append(VascularAccess.PULMONARY_ARTERY_CATHETER)
-        confidence = calculate_pattern_confidence(
-            text, PA_CATHETER_PATTERNS, CENTRAL_LINE_PATTERNS
-        )
-        findings.append(
-            ExtractionFinding(
-                value=VascularAccess.PULMONARY_ARTERY_CATHETER.value,
-                confidence=confidence,
-                context=pa_matches[0][1],
-                source_field=source_field,
+
+def extract_vascular_access_batch(
+    notes: pd.Series, source_field: str = "procedure_notes"
+) -> pd.DataFrame:
+    """
+    Extract vascular access for a whole column of notes.
+
+    Category detection runs column-wise through ``batch_pattern_hits`` and
+    findings are only built for rows with a category hit. Each row equals
+    ``extract_vascular_access(note)``.
+
+    Args:
+        notes: Series of procedure notes (values may be None or NaN)
+        source_field: Name of the field being analyzed (for tracking)
+
+    Returns:
+        DataFrame indexed like ``notes`` with ``vascular_access`` and
+        ``findings`` list columns.
+    """
+    text_values, hit_matrix = batch_pattern_hits(
+        notes, _VASCULAR_SENTINEL, _VASCULAR_CATEGORY_PATTERNS, _VASCULAR_LITERALS
+    )
+    vascular: list[list[VascularAccess]] = [[] for _ in range(len(notes))]
+    findings: list[list[ExtractionFinding]] = [[] for _ in range(len(notes))]
+    for row in np.flatnonzero(hit_matrix.any(axis=1)).tolist():
+        text = text_values[row]
+        folded_text = fold_ascii(text)
+        contexts = [
+            pattern.first_match_context(text, folded_text) if hit else None
+            for pattern, hit in zip(
+                _VASCULAR_CATEGORY_PATTERNS, hit_matrix[row].tolist(), strict=True
             )
+        ]
+        vascular[row], findings[row] = _build_vascular_results(
+            text, contexts, source_field
         )
 
-    return remove_duplicates_preserve_order(vascular), findings
+    return pd.DataFrame(
+        {"vascular_access": vascular, "findings": findings}, index=notes.index
+    )
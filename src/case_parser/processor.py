@@ -8,30 +8,39 @@ import multiprocessing as mp
 import threading
 from collections.abc import Hashable, Mapping, Sequence
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from itertools import chain, starmap
+from types import MappingProxyType
 from typing import Any
 
 import pandas as pd
 
 from .domain import (
     AgeCategory,
+    AirwayManagement,
     AnesthesiaType,
+    ExtractionFinding,
+    MonitoringTechnique,
     ParsedCase,
     ProcedureCategory,
+    VascularAccess,
 )
 from .extractors import (
     clean_names,
     extract_airway_management,
+    extract_airway_management_batch,
     extract_monitoring,
+    extract_monitoring_batch,
     extract_vascular_access,
+    extract_vascular_access_batch,
 )
 from .ml import get_hybrid_classifier
 from .ml.config import DEFAULT_ML_THRESHOLD
 from .ml.hybrid import HybridClassifier
 from .models import OUTPUT_COLUMNS, STANDALONE_OUTPUT_COLUMNS, ColumnMap
-from .patterns.age_patterns import AGE_RANGES
+from .patterns.age_patterns import AGE_RANGES, categorize_ages
 from .patterns.anesthesia_patterns import (
     ANESTHESIA_MAPPING,
     GA_NOTE_KEYWORDS,
@@ -43,6 +52,7 @@ from .patterns.block_site_patterns import (
     PERIPHERAL_BLOCK_SITE_TERMS,
     normalize_block_site_terms,
 )
+from .patterns.extraction_utils import remove_duplicates_preserve_order
 from .types import Scalar
 
 logger = logging.getLogger(__name__)
@@ -53,13 +63,69 @@ _CANONICAL_BLOCK_SITE_TERMS = {
 _GENERIC_PERIPHERAL_BLOCK_SITE = "Other - peripheral nerve blockade site"
 _PROCESS_POOL_MIN_ROWS = 25_000
 _PROCESS_POOL_TARGET_CHUNK_ROWS = 12_500
+# Read-only lookup tables shared by every CaseProcessor instance.
+_AGE_CATEGORY_BY_LABEL: Mapping[str, AgeCategory] = MappingProxyType({
+    "a. < 3 months": AgeCategory.UNDER_3_MONTHS,
+    "b. >= 3 mos. and < 3 yr.": AgeCategory.THREE_MOS_TO_3_YR,
+    "c. >= 3 yr. and < 12 yr.": AgeCategory.THREE_YR_TO_12_YR,
+    "d. >= 12 yr. and < 65 yr.": AgeCategory.TWELVE_YR_TO_65_YR,
+    "e. >= 65 year": AgeCategory.OVER_65_YR,
+})
+# Keyword -> (category label, enum) resolved once at import so each lookup is a
+# single dict pass; None marks a category label with no AnesthesiaType.
+_ANESTHESIA_CATEGORY_TO_ENUM: Mapping[str, AnesthesiaType] = MappingProxyType({
+    "GA": AnesthesiaType.GENERAL,
+    "MAC": AnesthesiaType.MAC,
+    "Spinal": AnesthesiaType.SPINAL,
+    "Epidural": AnesthesiaType.EPIDURAL,
+    "CSE": AnesthesiaType.CSE,
+})
+_ANESTHESIA_KEYWORD_TYPES: Mapping[str, tuple[str, AnesthesiaType | None]] = (
+    MappingProxyType({
+        keyword: (category, _ANESTHESIA_CATEGORY_TO_ENUM.get(category))
+        for keyword, category in ANESTHESIA_MAPPING.items()
+    })
+)
 _PROCESS_CHUNK_LOCK = threading.Lock()
 _PROCESS_CHUNK_STATE: dict[str, Any] = {
     "df": None,
+    "dates": None,
     "processor": None,
 }
 
 
+def _is_missing(value: object) -> bool:
+    """Return ``pd.isna(value)`` for a scalar, skipping pandas for None and str.
+
+    process_dataframe() hands rows over with missing cells already set to None,
+    so most checks resolve on the first two tests without a pandas dispatch.
+    """
+    if value is None:
+        return True
+    if type(value) is str:
+        return False
+    return pd.isna(value)
+
+
+@lru_cache(maxsize=4096)
+def _match_anesthesia_keyword(
+    input_str: str,
+) -> tuple[str, AnesthesiaType | None] | None:
+    """Return the first ANESTHESIA_MAPPING entry whose keyword is in the text.
+
+    The anesthesia type column has few distinct values, so after the first
+    row each value resolves with one cache lookup instead of a keyword scan.
+    """
+    return next(
+        (
+            entry
+            for keyword, entry in _ANESTHESIA_KEYWORD_TYPES.items()
+            if keyword in input_str
+        ),
+        None,
+    )
+
+
 def _get_process_pool_context() -> mp.context.BaseContext | None:
     """Return a fork-based context when the runtime supports it."""
     try:
@@ -86,15 +152,18 @@ def _init_process_chunk_worker(
 def _process_dataframe_chunk(span: tuple[int, int]) -> list[ParsedCase]:
     """Process one dataframe span using inherited forked state."""
     dataframe = _PROCESS_CHUNK_STATE["df"]
+    date_preparations = _PROCESS_CHUNK_STATE["dates"]
     processor = _PROCESS_CHUNK_STATE["processor"]
-    if dataframe is None:
+    if dataframe is None or date_preparations is None:
         raise RuntimeError("process chunk dataframe was not initialized")
     if processor is None:
         raise RuntimeError("process chunk worker processor was not initialized")
 
     start, end = span
     chunk = dataframe.iloc[start:end].reset_index(drop=True)
-    return processor.process_dataframe(chunk, workers=1)
+    return processor._process_rows_in_process(
+        chunk, workers=1, date_preparations=date_preparations[start:end]
+    )
 
 
 @dataclass
@@ -110,6 +179,12 @@ class _ParsedRowMetadata:
     services: list[str]
     procedure_category: ProcedureCategory
     procedure_text: object
+    airway: tuple[list[AirwayManagement], list[ExtractionFinding]] | None = None
+    vascular: tuple[list[VascularAccess], list[ExtractionFinding]] | None = None
+    monitoring: tuple[list[MonitoringTechnique], list[ExtractionFinding]] | None = None
+    procedure_monitoring: (
+        tuple[list[MonitoringTechnique], list[ExtractionFinding]] | None
+    ) = None
 
 
 @dataclass(frozen=True)
@@ -139,6 +214,13 @@ class _PreparedRow:
     services: list[str]
     procedure_category: ProcedureCategory
     procedure_warnings: list[str]
+    airway: tuple[list[AirwayManagement], list[ExtractionFinding]] | None = None
+    vascular: tuple[list[VascularAccess], list[ExtractionFinding]] | None = None
+    monitoring: tuple[list[MonitoringTechnique], list[ExtractionFinding]] | None = None
+    procedure_monitoring: (
+        tuple[list[MonitoringTechnique], list[ExtractionFinding]] | None
+    ) = None
+    age: tuple[AgeCategory | None, list[str]] | None = None
 
 
 class CaseProcessor:
@@ -183,6 +265,23 @@ class CaseProcessor:
             return timestamp.replace(tzinfo=UTC)
         return timestamp.astimezone(UTC)
 
+    @classmethod
+    def _timestamps_to_utc(cls, parsed: pd.Series) -> list[Any]:
+        """Normalize a parsed date column to UTC-aware datetimes.
+
+        Datetime columns are localized or converted to UTC in one vectorized
+        step; object columns holding mixed offsets fall back to per-value
+        normalization. Unparsed entries stay NaT.
+        """
+        if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+            return parsed.dt.tz_convert(UTC).dt.to_pydatetime().tolist()
+        if pd.api.types.is_datetime64_dtype(parsed.dtype):
+            return parsed.dt.tz_localize(UTC).dt.to_pydatetime().tolist()
+        return [
+            cls._normalize_timestamp_to_utc(value) if pd.notna(value) else value
+            for value in parsed.tolist()
+        ]
+
     def parse_date(self, value: Scalar) -> tuple[datetime, list[str]]:
         """Parse date with fallback to default year.
 
@@ -208,6 +307,25 @@ class CaseProcessor:
             Tuple of (age_category, warnings_list) where age_category is None
             when the value is missing or invalid.
         """
+        age_float, warnings = CaseProcessor._coerce_age(age)
+        if age_float is None:
+            return None, warnings
+
+        # Find first range where age is below upper bound
+        for range_ in AGE_RANGES:
+            if age_float < range_.upper_bound:
+                return _AGE_CATEGORY_BY_LABEL.get(range_.category), warnings
+
+        return None, warnings
+
+    @staticmethod
+    def _coerce_age(age: Scalar) -> tuple[float | None, list[str]]:
+        """Convert a raw age to years, collecting validation warnings.
+
+        Returns:
+            Tuple of (age_in_years, warnings_list) where the age is None when
+            the value is missing or not numeric.
+        """
         warnings = []
 
         if age is None or (isinstance(age, float) and pd.isna(age)):
@@ -224,20 +342,25 @@ class CaseProcessor:
         if age_float < 0 or age_float > 120:
             warnings.append(f"Age {age_float} is outside expected range (0-120)")
 
-        # Find first range where age is below upper bound
-        for range_ in AGE_RANGES:
-            if age_float < range_.upper_bound:
-                # Map to enum
-                category_map = {
-                    "a. < 3 months": AgeCategory.UNDER_3_MONTHS,
-                    "b. >= 3 mos. and < 3 yr.": AgeCategory.THREE_MOS_TO_3_YR,
-                    "c. >= 3 yr. and < 12 yr.": AgeCategory.THREE_YR_TO_12_YR,
-                    "d. >= 12 yr. and < 65 yr.": AgeCategory.TWELVE_YR_TO_65_YR,
-                    "e. >= 65 year": AgeCategory.OVER_65_YR,
-                }
-                return category_map.get(range_.category), warnings
+        return age_float, warnings
 
-        return None, warnings
+    @staticmethod
+    def _prepare_ages(
+        values: list[Any],
+    ) -> list[tuple[AgeCategory | None, list[str]]]:
+        """Categorize many ages at once with ``determine_age_category`` results.
+
+        Each value is validated individually so warnings stay row-specific;
+        range lookup then runs as one vectorized search over the batch.
+        """
+        coerced = [CaseProcessor._coerce_age(value) for value in values]
+        labels = categorize_ages([
+            math.nan if age_float is None else age_float for age_float, _ in coerced
+        ])
+        return [
+            (_AGE_CATEGORY_BY_LABEL.get(label), warnings)
+            for label, (_age_float, warnings) in zip(labels, coerced, strict=True)
+        ]
 
     @staticmethod
     def map_anesthesia_type(
@@ -263,23 +386,14 @@ class CaseProcessor:
 
         input_str = str(anesthesia_input).strip().upper()
 
-        # Convert standardized string category from patterns file to enum.
-        category_to_enum = {
-            "GA": AnesthesiaType.GENERAL,
-            "MAC": AnesthesiaType.MAC,
-            "Spinal": AnesthesiaType.SPINAL,
-            "Epidural": AnesthesiaType.EPIDURAL,
-            "CSE": AnesthesiaType.CSE,
-        }
-
         # Return first matching anesthesia type from pattern definitions.
-        for keyword, category in ANESTHESIA_MAPPING.items():
-            if keyword in input_str:
-                mapped = category_to_enum.get(category)
-                if mapped is not None:
-                    return mapped, warnings
-                warnings.append(f"Unsupported anesthesia mapping value: {category}")
-                return None, warnings
+        match = _match_anesthesia_keyword(input_str)
+        if match is not None:
+            category, mapped = match
+            if mapped is not None:
+                return mapped, warnings
+            warnings.append(f"Unsupported anesthesia mapping value: {category}")
+            return None, warnings
 
         # Unrecognized type
         warnings.append(f"Unrecognized anesthesia type: {anesthesia_input}")
@@ -328,7 +442,7 @@ class CaseProcessor:
         Returns:
             True if the value indicates an emergency case, False otherwise.
         """
-        if pd.isna(value):
+        if _is_missing(value):
             return False
         return str(value).strip().upper() in {"E", "Y", "YES", "TRUE", "1"}
 
@@ -363,8 +477,7 @@ class CaseProcessor:
                 ["Inferred general anesthesia from airway management findings"],
             )
 
-        procedure_upper = "" if pd.isna(procedure_text) else str(procedure_text).upper()
-        notes_upper = "" if pd.isna(notes) else str(notes).upper()
+        notes_upper = "" if _is_missing(notes) else str(notes).upper()
         if any(keyword in notes_upper for keyword in MAC_NOTE_KEYWORDS):
             return (
                 AnesthesiaType.MAC,
@@ -377,6 +490,9 @@ class CaseProcessor:
                 ["Inferred general anesthesia from note text"],
             )
 
+        procedure_upper = (
+            "" if _is_missing(procedure_text) else str(procedure_text).upper()
+        )
         if any(
             keyword in procedure_upper
             for keyword in MAC_WITHOUT_AIRWAY_PROCEDURE_KEYWORDS
@@ -416,7 +532,7 @@ class CaseProcessor:
         """
         if confidence_scores:
             return sum(confidence_scores) / len(confidence_scores), []
-        if pd.isna(notes) or not str(notes).strip():
+        if _is_missing(notes) or not str(notes).strip():
             return 0.7, ["No procedure notes available for extraction"]
         return 0.9, []
 
@@ -433,14 +549,18 @@ class CaseProcessor:
     @staticmethod
     def _split_services(raw_services: Scalar) -> list[str]:
         """Split a multiline services field into normalized items."""
-        if pd.isna(raw_services):
+        if _is_missing(raw_services):
             return []
-        return [item.strip() for item in str(raw_services).split("\n") if item.strip()]
+        return [
+            item
+            for item in (part.strip() for part in str(raw_services).split("\n"))
+            if item
+        ]
 
     @staticmethod
     def _optional_str(value: object) -> str | None:
         """Convert non-null values to string and preserve nulls as None."""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         return str(value)
 
@@ -455,7 +575,7 @@ class CaseProcessor:
     @staticmethod
     def _optional_float(value: Scalar) -> float | None:
         """Convert non-null values to float, preserving nulls."""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         try:
             return float(str(value).strip())
@@ -465,7 +585,7 @@ class CaseProcessor:
     @staticmethod
     def _clean_provider_name(value: Scalar) -> str | None:
         """Normalize provider names when present."""
-        if pd.isna(value):
+        if _is_missing(value):
             return None
         return clean_names(value)
 
@@ -526,7 +646,9 @@ class CaseProcessor:
             return raw_block_type
 
         normalized_terms = {
-            term.strip() for term in normalized_block_type.split(";") if term.strip()
+            term
+            for term in (part.strip() for part in normalized_block_type.split(";"))
+            if term
         }
         if not normalized_terms:
             return raw_block_type
@@ -578,8 +700,10 @@ class CaseProcessor:
             timestamp, date_warnings = self.parse_date(row.get(self.column_map.date))
             all_warnings.extend(date_warnings)
 
-        age_category, age_warnings = self.determine_age_category(
-            row.get(self.column_map.age)
+        age_category, age_warnings = (
+            prepared.age
+            if prepared is not None and prepared.age is not None
+            else self.determine_age_category(row.get(self.column_map.age))
         )
         all_warnings.extend(age_warnings)
 
@@ -615,6 +739,12 @@ class CaseProcessor:
             services=services,
             procedure_category=procedure_category,
             procedure_text=procedure_text,
+            airway=prepared.airway if prepared is not None else None,
+            vascular=prepared.vascular if prepared is not None else None,
+            monitoring=prepared.monitoring if prepared is not None else None,
+            procedure_monitoring=(
+                prepared.procedure_monitoring if prepared is not None else None
+            ),
         )
 
     def _extract_case_data(
@@ -629,9 +759,14 @@ class CaseProcessor:
 
         Monitoring extraction runs on both free-text notes and the procedure
         text so technique signals present only in the scheduled procedure are
-        still captured.
+        still captured. Airway, vascular and monitoring extraction reuse the
+        batch results on ``metadata`` when they were precomputed for this row.
         """
-        airway_mgmt, airway_findings = extract_airway_management(notes)
+        airway_mgmt, airway_findings = (
+            metadata.airway
+            if metadata.airway is not None
+            else extract_airway_management(notes)
+        )
         self._extend_findings(airway_findings, all_findings, confidence_scores)
 
         anesthesia_type, infer_warnings = self._infer_anesthesia_type(
@@ -643,19 +778,35 @@ class CaseProcessor:
         )
         all_warnings.extend(infer_warnings)
 
-        vascular_access, vascular_findings = extract_vascular_access(notes)
+        vascular_access, vascular_findings = (
+            metadata.vascular
+            if metadata.vascular is not None
+            else extract_vascular_access(notes)
+        )
         self._extend_findings(vascular_findings, all_findings, confidence_scores)
 
-        monitoring, monitoring_findings = extract_monitoring(notes)
+        monitoring, monitoring_findings = (
+            metadata.monitoring
+            if metadata.monitoring is not None
+            else extract_monitoring(notes)
+        )
         self._extend_findings(monitoring_findings, all_findings, confidence_scores)
 
-        if pd.notna(metadata.procedure_text) and str(metadata.procedure_text).strip():
-            procedure_monitoring, procedure_findings = extract_monitoring(
-                metadata.procedure_text, source_field="procedure"
+        if (
+            not _is_missing(metadata.procedure_text)
+            and str(metadata.procedure_text).strip()
+        ):
+            procedure_monitoring, procedure_findings = (
+                metadata.procedure_monitoring
+                if metadata.procedure_monitoring is not None
+                else extract_monitoring(
+                    metadata.procedure_text, source_field="procedure"
+                )
             )
-            for monitor in procedure_monitoring:
-                if monitor not in monitoring:
-                    monitoring.append(monitor)
+            monitoring = remove_duplicates_preserve_order([
+                *monitoring,
+                *procedure_monitoring,
+            ])
             self._extend_findings(procedure_findings, all_findings, confidence_scores)
 
         return _ExtractionResult(
@@ -690,7 +841,11 @@ class CaseProcessor:
             metadata = self._parse_row_metadata(row, all_warnings, prepared=prepared)
             notes = row.get(self.column_map.procedure_notes)
             extracted = self._extract_case_data(
-                notes, metadata, all_warnings, all_findings, confidence_scores
+                notes,
+                metadata,
+                all_warnings,
+                all_findings,
+                confidence_scores,
             )
             overall_confidence, conf_warnings = self._calculate_confidence(
                 confidence_scores, notes
@@ -753,25 +908,33 @@ class CaseProcessor:
         # Handle ASA with emergent flag
         warnings: list[str] = []
         raw_asa = row.get(self.column_map.asa)
-        asa_str = "" if pd.isna(raw_asa) else str(raw_asa)
+        asa_str = "" if _is_missing(raw_asa) else str(raw_asa)
         emergent = self.normalize_emergent_flag(row.get(self.column_map.emergent))
 
-        if emergent and "E" not in asa_str.upper():
+        if emergent and "E" not in asa_str and "e" not in asa_str:
             asa_str = f"{asa_str}E" if asa_str else "E"
             warnings.append("Added 'E' to ASA status based on emergent flag")
         return asa_str, emergent, raw_asa, warnings
 
     def _prepare_rows(
-        self, rows: Sequence[Mapping[Hashable, Any]]
+        self,
+        rows: Sequence[Mapping[Hashable, Any]],
+        date_preparations: Sequence[tuple[datetime, list[str]]] | None = None,
     ) -> list[_PreparedRow]:
         """Precompute per-row metadata for a dataframe batch.
 
-        This batches date parsing and hybrid categorization so downstream
-        row-processing can reuse normalized timestamps, services, categories,
-        and warning lists.
+        This batches date parsing, age categorization, hybrid categorization
+        and airway/vascular/monitoring extraction so downstream row-processing
+        can reuse normalized timestamps, age categories, services, categories,
+        extraction findings, and warning lists. ``date_preparations`` lets a
+        process chunk reuse dates parsed once over the whole dataframe.
         """
-        date_preparations = self._prepare_dates([
-            row.get(self.column_map.date) for row in rows
+        if date_preparations is None:
+            date_preparations = self._prepare_dates([
+                row.get(self.column_map.date) for row in rows
+            ])
+        age_preparations = self._prepare_ages([
+            row.get(self.column_map.age) for row in rows
         ])
         services_list = [
             self._split_services(row.get(self.column_map.services)) for row in rows
@@ -783,15 +946,37 @@ class CaseProcessor:
             )
         )
         classifications = self._classify_categorization_inputs(categorization_inputs)
+        notes = pd.Series(
+            [row.get(self.column_map.procedure_notes) for row in rows], dtype=object
+        )
+        airway_results = extract_airway_management_batch(notes)
+        vascular_results = extract_vascular_access_batch(notes)
+        monitoring_results = extract_monitoring_batch(notes)
+        procedure_monitoring_results = extract_monitoring_batch(
+            pd.Series(
+                [row.get(self.column_map.procedure) for row in rows], dtype=object
+            ),
+            source_field="procedure",
+        )
         prepared_rows: list[_PreparedRow] = []
         for (
             (timestamp, date_warnings),
             services,
             (procedure_category, procedure_warnings),
+            airway,
+            vascular,
+            monitoring,
+            procedure_monitoring,
+            age,
         ) in zip(
             date_preparations,
             services_list,
             classifications,
+            airway_results.itertuples(index=False, name=None),
+            vascular_results.itertuples(index=False, name=None),
+            monitoring_results.itertuples(index=False, name=None),
+            procedure_monitoring_results.itertuples(index=False, name=None),
+            age_preparations,
             strict=True,
         ):
             prepared_rows.append(
@@ -801,6 +986,11 @@ class CaseProcessor:
                     services=services,
                     procedure_category=procedure_category,
                     procedure_warnings=procedure_warnings,
+                    airway=airway,
+                    vascular=vascular,
+                    monitoring=monitoring,
+                    procedure_monitoring=procedure_monitoring,
+                    age=age,
                 )
             )
         return prepared_rows
@@ -827,13 +1017,15 @@ class CaseProcessor:
             )
 
         prepared_dates: list[tuple[datetime, list[str]]] = []
-        parsed_values = parsed.tolist()
+        utc_values = self._timestamps_to_utc(parsed)
         missing_values = missing_mask.tolist()
+        parsed_values = parsed.notna().tolist()
         default_timestamp = self._default_timestamp
-        for value, is_missing, timestamp in zip(
+        for value, is_missing, is_parsed, timestamp in zip(
             values,
             missing_values,
             parsed_values,
+            utc_values,
             strict=False,
         ):
             if is_missing:
@@ -843,8 +1035,8 @@ class CaseProcessor:
                 ))
                 continue
 
-            if pd.notna(timestamp):
-                prepared_dates.append((self._normalize_timestamp_to_utc(timestamp), []))
+            if is_parsed:
+                prepared_dates.append((timestamp, []))
                 continue
 
             prepared_dates.append((
@@ -857,12 +1049,12 @@ class CaseProcessor:
 
         return prepared_dates
 
-    def _should_use_process_pool(self, row_count: int, workers: int) -> bool:
+    @staticmethod
+    def _should_use_process_pool(row_count: int, workers: int) -> bool:
         """Return whether large-batch process chunking is worth attempting."""
         return (
             workers > 1
             and row_count >= _PROCESS_POOL_MIN_ROWS
-            and self.classifier.ml_predictor is not None
             and _get_process_pool_context() is not None
         )
 
@@ -887,10 +1079,13 @@ class CaseProcessor:
         df: pd.DataFrame,
         workers: int,
     ) -> list[ParsedCase]:
-        """Process a large ML-heavy dataframe through forked dataframe chunks.
+        """Process a large dataframe through forked dataframe chunks.
 
         This path is used only when large-batch heuristics indicate that the
-        process-pool startup cost is likely to be worthwhile.
+        process-pool startup cost is likely to be worthwhile. Dates are parsed
+        once over the whole dataframe before forking: ``pd.to_datetime`` infers
+        its format from the first value, so per-chunk parsing could disagree
+        with the in-process path on mixed-format columns.
         """
         context = _get_process_pool_context()
         if context is None:
@@ -904,7 +1099,13 @@ class CaseProcessor:
             raise RuntimeError("process chunk state is already in use")
 
         try:
+            date_column = self.column_map.date
             _PROCESS_CHUNK_STATE["df"] = df
+            _PROCESS_CHUNK_STATE["dates"] = self._prepare_dates(
+                df[date_column].tolist()
+                if date_column in df.columns
+                else [None] * len(df)
+            )
             _PROCESS_CHUNK_STATE["processor"] = None
             try:
                 with ProcessPoolExecutor(
@@ -923,6 +1124,7 @@ class CaseProcessor:
                     )
             finally:
                 _PROCESS_CHUNK_STATE["df"] = None
+                _PROCESS_CHUNK_STATE["dates"] = None
                 _PROCESS_CHUNK_STATE["processor"] = None
         finally:
             _PROCESS_CHUNK_LOCK.release()
@@ -936,9 +1138,9 @@ class CaseProcessor:
             df: Input DataFrame with columns matching self.column_map.
                 Missing columns are warned about but do not halt processing.
             workers: Number of worker slots for parallel processing. Defaults
-                to 1 (sequential). Large ML-heavy batches may use process
-                chunks; smaller batches otherwise stay in-process and use row
-                threads when workers > 1.
+                to 1 (sequential). Large batches may use process chunks;
+                smaller batches otherwise stay in-process and use row threads
+                when workers > 1.
 
         Returns:
             List of ParsedCase objects, one per row. Rows that raise an
@@ -977,32 +1179,52 @@ class CaseProcessor:
                 logger.info("Successfully processed %d cases", len(processed_cases))
                 return processed_cases
 
-        rows = df.to_dict(orient="records")
+        processed_cases = self._process_rows_in_process(df, workers)
+        logger.info("Successfully processed %d cases", len(processed_cases))
+        return processed_cases
+
+    def _process_rows_in_process(
+        self,
+        df: pd.DataFrame,
+        workers: int,
+        date_preparations: Sequence[tuple[datetime, list[str]]] | None = None,
+    ) -> list[ParsedCase]:
+        """Batch-prepare and process dataframe rows in the current process."""
+        # Rows are only read through column_map, so unmapped source columns
+        # are left out of the per-row dicts instead of being copied and dropped.
+        # Missing cells become None in one column-wise sweep, so row helpers
+        # can test them without a pd.isna() dispatch per cell.
+        mapped_df = df.loc[:, df.columns.isin(astuple(self.column_map))].astype(object)
+        mapped_df = mapped_df.where(mapped_df.notna(), None)
+        # Column labels are resolved once per frame and zipped with the plain
+        # object rows; to_dict(orient="records") re-boxes every cell.
+        column_names = mapped_df.columns.tolist()
+        rows = [
+            dict(zip(column_names, values, strict=True))
+            for values in mapped_df.to_numpy().tolist()
+        ]
         try:
-            prepared_rows: list[_PreparedRow | None] = [*self._prepare_rows(rows)]
+            prepared_rows: list[_PreparedRow | None] = [
+                *self._prepare_rows(rows, date_preparations)
+            ]
         except Exception as e:
             logger.exception(
                 "Batch row preparation failed; falling back to per-row processing: %s",
                 e,
             )
             prepared_rows = [None for _ in rows]
-        processed_cases: list[ParsedCase] = []
         if workers == 1:
-            processed_cases = list(
+            return list(
                 starmap(self.process_row, zip(rows, prepared_rows, strict=False))
             )
-        else:
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                processed_cases = list(
-                    executor.map(
-                        self.process_row,
-                        rows,
-                        prepared_rows,
-                    )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    self.process_row,
+                    rows,
+                    prepared_rows,
                 )
-
-        logger.info("Successfully processed %d cases", len(processed_cases))
-        return processed_cases
+            )
 
     @staticmethod
     def cases_to_dataframe(cases: list[ParsedCase]) -> pd.DataFrame:
@@ -66,9 +66,9 @@ def _normalized_block_terms(case: ParsedCase) -> set[str]:
     if not case.nerve_block_type:
         return set()
     return {
-        term.strip()
-        for term in case.nerve_block_type.split(";")
-        if term and term.strip()
+        term
+        for term in (part.strip() for part in case.nerve_block_type.split(";"))
+        if term
     }
 
 
@@ -3,16 +3,68 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from enum import Enum
+from itertools import batched
 from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .domain import ParsedCase
+from .domain import (
+    LOW_CONFIDENCE_THRESHOLD,
+    AirwayManagement,
+    MonitoringTechnique,
+    ParsedCase,
+    VascularAccess,
+)
+
+# List items encoded per call when streaming a JSON section to disk.
+_JSON_STREAM_BATCH_SIZE = 500
+
+
+def _value_counts(counts: Counter[Enum]) -> dict[str, int]:
+    """Key an enum histogram by member value, keeping first-seen order."""
+    return {member.value: count for member, count in counts.items()}
+
+
+def _encode_json(value: object) -> bytes:
+    """Encode ``value`` as two-space indented JSON bytes."""
+    return json.dumps(value, indent=2).encode()
+
+
+def _write_json(sections: Iterable[tuple[str, Any]], output_path: Path) -> None:
+    """Write top-level report sections as indented JSON, streaming list items.
+
+    List-valued sections may be any iterable other than a dict; items are
+    encoded and written in batches of ``_JSON_STREAM_BATCH_SIZE`` as they are
+    produced, so the full document is never held in memory. The file matches
+    ``json.dumps(dict(sections), indent=2)``.
+    """
+    with output_path.open("wb") as handle:
+        handle.write(b"{")
+        separator = b"\n  "
+        for key, value in sections:
+            handle.write(separator + _encode_json(key) + b": ")
+            separator = b",\n  "
+            if isinstance(value, dict):
+                handle.write(_encode_json(value).replace(b"\n", b"\n  "))
+                continue
+            batch_separator = b"[\n  "
+            for batch in batched(value, _JSON_STREAM_BATCH_SIZE, strict=False):
+                # Drop the batch's own brackets and indent its items one
+                # level deeper, as members of the section list.
+                items = _encode_json(list(batch))[2:-2].replace(b"\n", b"\n  ")
+                handle.write(batch_separator + items)
+                batch_separator = b",\n  "
+            handle.write(b"[]" if batch_separator == b"[\n  " else b"\n  ]")
+        handle.write(b"}" if separator == b"\n  " else b"\n}")
 
 
 class ValidationReport:
@@ -22,9 +74,24 @@ class ValidationReport:
         """Initialize with list of parsed cases.
 
         Args:
-            cases: Parsed cases to validate and report on.
+            cases: Parsed cases to validate and report on. The report treats
+                them as fixed once constructed.
         """
         self.cases = cases
+        # Per-case columns for the vectorized counts and problematic-case mask
+        self._confidence = np.fromiter(
+            (case.confidence_score for case in cases),
+            dtype=np.float64,
+            count=len(cases),
+        )
+        self._warning_counts = np.fromiter(
+            (len(case.parsing_warnings) for case in cases),
+            dtype=np.intp,
+            count=len(cases),
+        )
+        # Problematic-case scans keyed by (min_warnings, max_confidence), so
+        # generating several reports scans the cases once per threshold pair.
+        self._problematic_cache: dict[tuple[int, float], tuple[ParsedCase, ...]] = {}
 
     def get_summary(self) -> dict[str, Any]:
         """Get overall validation summary statistics.
@@ -36,39 +103,36 @@ class ValidationReport:
             to count of cases missing that field).
         """
         total_cases = len(self.cases)
-        cases_with_warnings = sum(1 for case in self.cases if case.has_warnings())
-        low_confidence_cases = sum(1 for case in self.cases if case.is_low_confidence())
+        cases_with_warnings = int(np.count_nonzero(self._warning_counts))
+        low_confidence_cases = int(
+            np.count_nonzero(self._confidence < LOW_CONFIDENCE_THRESHOLD)
+        )
+        missing_episode_id = 0
+        missing_provider = 0
+        missing_procedure = 0
+        missing_age = 0
+        warning_counts: Counter[str] = Counter()
 
-        # Collect all unique warnings
-        all_warnings = []
+        # One pass over the cases gathers the remaining counts
         for case in self.cases:
-            all_warnings.extend(case.parsing_warnings)
-
-        warning_counts: dict[str, int] = {}
-        for warning in all_warnings:
-            warning_counts[warning] = warning_counts.get(warning, 0) + 1
-
-        # Calculate average confidence
+            warning_counts.update(case.parsing_warnings)
+            # Missing critical fields
+            missing_episode_id += not case.episode_id
+            missing_provider += not case.responsible_provider
+            missing_procedure += not case.procedure
+            missing_age += not case.age_category
+
+        # sum() keeps its compensated float summation for the average
         avg_confidence = (
-            sum(case.confidence_score for case in self.cases) / total_cases
-            if total_cases > 0
-            else 0
+            sum(self._confidence.tolist()) / total_cases if total_cases > 0 else 0
         )
 
-        # Missing critical fields
-        missing_episode_id = sum(1 for case in self.cases if not case.episode_id)
-        missing_provider = sum(
-            1 for case in self.cases if not case.responsible_provider
-        )
-        missing_procedure = sum(1 for case in self.cases if not case.procedure)
-        missing_age = sum(1 for case in self.cases if not case.age_category)
-
         return {
             "total_cases": total_cases,
             "cases_with_warnings": cases_with_warnings,
             "low_confidence_cases": low_confidence_cases,
             "average_confidence": round(avg_confidence, 3),
-            "warning_types": warning_counts,
+            "warning_types": dict(warning_counts),
             "missing_fields": {
                 "episode_id": missing_episode_id,
                 "provider": missing_provider,
@@ -95,17 +159,15 @@ class ValidationReport:
         Returns:
             List of problematic cases
         """
-        return [
-            case
-            for case in self.cases
-            if (
-                len(case.parsing_warnings) >= min_warnings
-                or (
-                    case.confidence_score < max_confidence
-                    and len(case.parsing_warnings) == 0
-                )
+        key = (min_warnings, max_confidence)
+        problematic = self._problematic_cache.get(key)
+        if problematic is None:
+            mask = (self._warning_counts >= min_warnings) | (
+                (self._confidence < max_confidence) & (self._warning_counts == 0)
             )
-        ]
+            problematic = tuple(self.cases[i] for i in np.flatnonzero(mask).tolist())
+            self._problematic_cache[key] = problematic
+        return list(problematic)
 
     @staticmethod
     def _print_summary_section(console: Console, summary: dict[str, Any]) -> None:
@@ -267,16 +329,22 @@ class ValidationReport:
             (validation summaries for flagged cases), and extraction_details
             (extraction performance statistics).
         """
-        summary = self.get_summary()
-        problematic = self.get_problematic_cases()
+        report = dict(self._json_report_sections())
+        report["problematic_cases"] = list(report["problematic_cases"])
+        return report
 
-        return {
-            "summary": summary,
-            "problematic_cases": [
-                case.get_validation_summary() for case in problematic
-            ],
-            "extraction_details": self._get_extraction_statistics(),
-        }
+    def _json_report_sections(self) -> Iterator[tuple[str, Any]]:
+        """Yield the JSON report's top-level sections in output order.
+
+        Problematic-case summaries are built lazily so save_report() can
+        stream them to disk one case at a time.
+        """
+        yield "summary", self.get_summary()
+        yield (
+            "problematic_cases",
+            (case.get_validation_summary() for case in self.get_problematic_cases()),
+        )
+        yield "extraction_details", self._get_extraction_statistics()
 
     def _get_extraction_statistics(self) -> dict[str, Any]:
         """Get statistics about extraction performance.
@@ -288,45 +356,39 @@ class ValidationReport:
         """
         total_cases = len(self.cases)
 
-        # Count extraction types
-        airway_extractions = sum(1 for case in self.cases if case.airway_management)
-        vascular_extractions = sum(1 for case in self.cases if case.vascular_access)
-        monitoring_extractions = sum(1 for case in self.cases if case.monitoring)
-
-        # Detailed extraction counts
-        airway_types: dict[str, int] = {}
-        vascular_types: dict[str, int] = {}
-        monitoring_types: dict[str, int] = {}
+        airway_extractions = 0
+        vascular_extractions = 0
+        monitoring_extractions = 0
+        # Detailed extraction counts, keyed by enum until the report is built
+        airway_types: Counter[AirwayManagement] = Counter()
+        vascular_types: Counter[VascularAccess] = Counter()
+        monitoring_types: Counter[MonitoringTechnique] = Counter()
 
         for case in self.cases:
-            for airway in case.airway_management:
-                airway_types[airway.value] = airway_types.get(airway.value, 0) + 1
-            for vascular in case.vascular_access:
-                vascular_types[vascular.value] = (
-                    vascular_types.get(vascular.value, 0) + 1
-                )
-            for monitor in case.monitoring:
-                monitoring_types[monitor.value] = (
-                    monitoring_types.get(monitor.value, 0) + 1
-                )
+            if case.airway_management:
+                airway_extractions += 1
+                airway_types.update(case.airway_management)
+            if case.vascular_access:
+                vascular_extractions += 1
+                vascular_types.update(case.vascular_access)
+            if case.monitoring:
+                monitoring_extractions += 1
+                monitoring_types.update(case.monitoring)
 
         return {
             "cases_with_airway_extraction": airway_extractions,
             "cases_with_vascular_extraction": vascular_extractions,
             "cases_with_monitoring_extraction": monitoring_extractions,
-            "airway_types": airway_types,
-            "vascular_types": vascular_types,
-            "monitoring_types": monitoring_types,
+            "airway_types": _value_counts(airway_types),
+            "vascular_types": _value_counts(vascular_types),
+            "monitoring_types": _value_counts(monitoring_types),
             "extraction_rate": {
-                "airway": round(airway_extractions / total_cases, 3)
-                if total_cases > 0
-                else 0,
-                "vascular": round(vascular_extractions / total_cases, 3)
-                if total_cases > 0
-                else 0,
-                "monitoring": round(monitoring_extractions / total_cases, 3)
-                if total_cases > 0
-                else 0,
+                name: round(count / total_cases, 3) if total_cases > 0 else 0
+                for name, count in (
+                    ("airway", airway_extractions),
+                    ("vascular", vascular_extractions),
+                    ("monitoring", monitoring_extractions),
+                )
             },
         }
 
@@ -338,19 +400,31 @@ class ValidationReport:
             flags and counts, confidence score, low-confidence flag, and
             a semicolon-separated list of missing critical fields.
         """
-        rows = []
+        if not self.cases:
+            return pd.DataFrame()
+
+        case_ids = []
+        warnings = []
+        missing_fields = []
         for case in self.cases:
-            summary = case.get_validation_summary()
-            rows.append({
-                "Case ID": summary["case_id"] or "",
-                "Has Warnings": "Yes" if summary["has_warnings"] else "No",
-                "Warning Count": summary["warning_count"],
-                "Warnings": "; ".join(summary["warnings"]),
-                "Confidence Score": f"{summary['confidence_score']:.3f}",
-                "Low Confidence": "Yes" if summary["is_low_confidence"] else "No",
-                "Missing Fields": "; ".join(summary["missing_fields"]) or "None",
-            })
-        return pd.DataFrame(rows)
+            case_ids.append(case.episode_id or "")
+            warnings.append("; ".join(case.parsing_warnings))
+            missing_fields.append(
+                "; ".join(case.get_missing_critical_fields()) or "None"
+            )
+
+        # Flags, counts and scores come straight from the per-case columns
+        return pd.DataFrame({
+            "Case ID": case_ids,
+            "Has Warnings": np.where(self._warning_counts > 0, "Yes", "No"),
+            "Warning Count": self._warning_counts,
+            "Warnings": warnings,
+            "Confidence Score": [f"{score:.3f}" for score in self._confidence.tolist()],
+            "Low Confidence": np.where(
+                self._confidence < LOW_CONFIDENCE_THRESHOLD, "Yes", "No"
+            ),
+            "Missing Fields": missing_fields,
+        })
 
     def save_report(self, output_path: str | Path, output_format: str = "text") -> None:
         """
@@ -370,8 +444,7 @@ class ValidationReport:
             text_report = self.generate_text_report()
             output_path.write_text(text_report, encoding="utf-8")
         elif output_format == "json":
-            json_report = self.generate_json_report()
-            output_path.write_text(json.dumps(json_report, indent=2), encoding="utf-8")
+            _write_json(self._json_report_sections(), output_path)
         elif output_format == "excel":
             df = self.to_dataframe()
             with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
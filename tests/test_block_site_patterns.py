@@ -82,3 +82,53 @@ def test_does_not_map_notes_without_block_context():
 
 def test_returns_raw_primary_block_if_no_context_and_no_term_match():
     assert normalize_block_site_terms("Unclassified value") == "Unclassified value"
+
+
+def test_rows_without_primary_block_share_one_result_across_notes():
+    first = normalize_block_site_terms(
+        None,
+        procedure_name="Spinal",
+        procedure_notes="Femoral line placed",
+    )
+    second = normalize_block_site_terms(
+        "",
+        procedure_name="Spinal",
+        procedure_notes="Interscalene mentioned in unrelated note",
+    )
+    assert first == second == "Lumbar"
+    assert (
+        normalize_block_site_terms(
+            "Peripheral nerve block",
+            procedure_name="Spinal",
+            procedure_notes="Interscalene catheter placed",
+        )
+        == "Interscalene; Lumbar"
+    )
+
+
+def test_case_procedure_only_changes_brachial_plexus_inference():
+    block_kwargs = {"procedure_name": "Peripheral nerve block"}
+    assert (
+        normalize_block_site_terms(
+            "Brachial plexus block",
+            case_procedure="Proximal humerus ORIF",
+            **block_kwargs,
+        )
+        == "Interscalene"
+    )
+    assert (
+        normalize_block_site_terms(
+            "Brachial plexus block",
+            case_procedure="Distal radius ORIF",
+            **block_kwargs,
+        )
+        == "Supraclavicular"
+    )
+    assert (
+        normalize_block_site_terms(
+            "Femoral block",
+            case_procedure="Shoulder arthroscopy",
+            **block_kwargs,
+        )
+        == "Femoral"
+    )
@@ -9,6 +9,9 @@ import pandas as pd
 
 from case_parser.domain import ProcedureCategory
 from case_parser.patterns.approach_patterns import (
+    ENDOVASCULAR_KEYWORDS,
+    OPEN_KEYWORDS,
+    _keyword_alternation,
     detect_approach,
     detect_intracerebral_pathology,
 )
@@ -51,6 +54,12 @@ class TestDetectApproach:
         # "STENT" (endovascular, not the explicit "ENDOVASCULAR"/"PERCUTANEOUS") + "OPEN" → unknown
         assert detect_approach("OPEN STENT PLACEMENT") == "unknown"
 
+    def test_keyword_alternation_matches_substring_any(self):
+        pattern = _keyword_alternation(ENDOVASCULAR_KEYWORDS)
+        for text in (*ENDOVASCULAR_KEYWORDS, *OPEN_KEYWORDS, "XEVARX", "PT A"):
+            expected = any(keyword in text for keyword in ENDOVASCULAR_KEYWORDS)
+            assert (pattern.search(text) is not None) == expected, text
+
 
 class TestDetectIntracerebralPathology:
     def test_returns_unknown_for_none(self):
@@ -127,6 +136,12 @@ class TestCategorizeVascular:
             == ProcedureCategory.MAJOR_VESSELS_OPEN
         )
 
+    def test_lowercase_input_is_normalized(self):
+        assert (
+            categorize_vascular("endovascular aneurysm repair")
+            == ProcedureCategory.MAJOR_VESSELS_ENDOVASCULAR
+        )
+
 
 class TestCategorizeIntracerebral:
     def test_endovascular_approach(self):
@@ -171,6 +186,22 @@ class TestCategorizeIntracerebral:
             == ProcedureCategory.INTRACEREBRAL_NONVASCULAR_OPEN
         )
 
+    def test_lowercase_input_is_normalized(self):
+        assert (
+            categorize_intracerebral("endovascular coiling")
+            == ProcedureCategory.INTRACEREBRAL_ENDOVASCULAR
+        )
+        assert (
+            categorize_intracerebral("craniotomy for tumor resection")
+            == ProcedureCategory.INTRACEREBRAL_NONVASCULAR_OPEN
+        )
+
+    def test_mixed_case_input_is_normalized_before_approach_detection(self):
+        category, _warnings = categorize_procedure(
+            "Craniotomy for aneurysm clipping", []
+        )
+        assert category == ProcedureCategory.INTRACEREBRAL_VASCULAR_OPEN
+
 
 class TestCategorizeObgyn:
     def test_cesarean_detection(self):
@@ -254,6 +285,12 @@ class TestCategorizeProcedure:
         assert len(warnings) == 1
         assert "Multiple procedure categories" in warnings[0]
 
+    def test_same_service_still_honors_procedure_exclusions(self):
+        cranial, _ = categorize_procedure("Craniotomy for tumor", ["NEUROSURGERY"])
+        spine, _ = categorize_procedure("Lumbar spine fusion", ["NEUROSURGERY"])
+        assert cranial == ProcedureCategory.INTRACEREBRAL_NONVASCULAR_OPEN
+        assert spine == ProcedureCategory.OTHER
+
     def test_single_match_no_warning(self):
         category, warnings = categorize_procedure("Lung surgery", ["THOR"])
         assert category == ProcedureCategory.INTRATHORACIC_NON_CARDIAC
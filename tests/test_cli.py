@@ -8,14 +8,18 @@ from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import pytest
 
 # noinspection PyProtectedMember
 from case_parser.cli import (
     _ProcessingOptions,
     _ProcessingRequest,
+    build_arg_parser,
+    columns_from_args,
     main,
     process_input,
     split_standalone_cases,
+    validate_arguments,
 )
 from case_parser.domain import ParsedCase, ProcedureCategory
 from case_parser.models import ColumnMap
@@ -199,6 +203,9 @@ def test_main_uses_standalone_signal_when_no_main_cases(tmp_path: Path):
         no_ml=True,
         ml_threshold=0.7,
         workers=1,
+        read_only=True,
+        nrows=None,
+        skiprows=None,
         v2=True,
         validation_report=None,
         log_level="INFO",
@@ -233,3 +240,35 @@ def test_main_uses_standalone_signal_when_no_main_cases(tmp_path: Path):
         "standalone orphan outputs were written" in msg for msg in printed_messages
     )
     assert not any("No cases to process" in msg for msg in printed_messages)
+
+
+@pytest.mark.parametrize("flag", ["--nrows", "--skiprows"])
+def test_validate_arguments_rejects_negative_row_limits(tmp_path: Path, flag: str):
+    input_file = tmp_path / "input.xlsx"
+    input_file.touch()
+    args = build_arg_parser().parse_args([
+        str(input_file),
+        str(tmp_path / "out.xlsx"),
+        flag,
+        "-1",
+    ])
+
+    with pytest.raises(ValueError, match="must be at least 0"):
+        validate_arguments(args)
+
+
+def test_columns_from_args_applies_only_provided_overrides():
+    args = build_arg_parser().parse_args([
+        "in.xlsx",
+        "out.xlsx",
+        "--col-date",
+        "Service Date",
+        "--col-nerve-block-type",
+        "Block",
+    ])
+
+    columns = columns_from_args(args)
+
+    assert columns.date == "Service Date"
+    assert columns.nerve_block_type == "Block"
+    assert columns.procedure == ColumnMap().procedure
@@ -1,15 +1,20 @@
 """Tests for CSV v2 format I/O operations."""
 
+import os
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from case_parser.domain import ProcedureCategory
+from case_parser.extractors import extract_attending
 from case_parser.io import (
     CsvHandler,
+    _technique_ranks,
     discover_csv_pairs,
     join_case_and_procedures,
 )
-from case_parser.models import ColumnMap
+from case_parser.models import TECHNIQUE_RANK, ColumnMap
 from case_parser.processor import CaseProcessor
 
 
@@ -41,6 +46,21 @@ def test_discover_csv_pairs_multiple_pairs(tmp_path):
     assert prefixes == {"DOCTOR1", "DOCTOR2"}
 
 
+def test_discover_csv_pairs_refreshes_when_directory_changes(tmp_path):
+    """Cached discovery results are invalidated by directory modifications."""
+    (tmp_path / "DOCTOR1.CaseList.csv").touch()
+    (tmp_path / "DOCTOR1.ProcedureList.csv").touch()
+    assert len(discover_csv_pairs(tmp_path)) == 1
+
+    (tmp_path / "DOCTOR2.CaseList.csv").touch()
+    (tmp_path / "DOCTOR2.ProcedureList.csv").touch()
+    # Bump mtime explicitly so coarse filesystem timestamps cannot hide the change.
+    mtime_ns = tmp_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+
+    assert len(discover_csv_pairs(tmp_path)) == 2
+
+
 def test_discover_csv_pairs_no_pairs_raises_error(tmp_path):
     """Test error when no matching pairs found."""
     with pytest.raises(ValueError, match="No matching CSV pairs found"):
@@ -299,6 +319,23 @@ def test_normalize_orphan_columns_preserves_comment_and_detail_text():
     )
 
 
+def test_normalize_orphan_columns_skips_missing_blank_and_repeated_text():
+    column_map = ColumnMap()
+    orphan_df = pd.DataFrame({
+        "MPOG_Case_ID": ["ORPHAN-4", "ORPHAN-5", "ORPHAN-6"],
+        "ProcedureName": [" Arterial line ", None, np.nan],
+        "Comment": ["Arterial line", "   ", pd.NA],
+        "Details": [20, np.nan, None],
+    })
+
+    notes = CsvHandler(column_map).normalize_orphan_columns(orphan_df)[
+        column_map.procedure_notes
+    ]
+
+    assert notes[0] == "Arterial line\n20.0"
+    assert notes[1:].isna().all()
+
+
 def test_normalize_orphan_columns_extracts_asa_date_and_attending():
     """ASA, date, and attending are populated from ProcedureList columns."""
     column_map = ColumnMap()
@@ -410,3 +447,88 @@ def test_normalize_orphan_columns_empty_df():
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 0
     assert column_map.episode_id in result.columns
+
+
+def test_csv_handler_read_skips_unused_columns_and_keeps_asa_text(tmp_path):
+    """Export reads keep only consumed columns and never coerce ASA to numbers."""
+    pd.DataFrame({
+        "MPOG_Case_ID": ["C1", "C2"],
+        "AIMS_Scheduled_DT": ["2025-01-01 08:00:00", "2025-01-02 09:00:00"],
+        "AIMS_Patient_Age_Years": [42, None],
+        "ASA_Status": ["2", None],
+        "AIMS_Actual_Procedure_Text": ["Appendectomy", "Cholecystectomy"],
+        "AnesAttendings": ["DOE, JANE@2025-01-01 08:00:00", pd.NA],
+        "UnusedWideColumn": ["x", "y"],
+    }).to_csv(tmp_path / "DOC.CaseList.csv", index=False)
+    pd.DataFrame({
+        "MPOG_Case_ID": ["C1"],
+        "ProcedureName": ["Intubation routine"],
+        "UnusedWideColumn": ["z"],
+    }).to_csv(tmp_path / "DOC.ProcedureList.csv", index=False)
+    column_map = ColumnMap()
+
+    result, orphans = CsvHandler(column_map).read(tmp_path)
+
+    assert "UnusedWideColumn" not in result.columns
+    assert orphans.empty
+    assert result[column_map.asa].tolist()[0] == "2"
+    assert pd.isna(result[column_map.asa].tolist()[1])
+    assert result[column_map.age].tolist()[0] == pytest.approx(42.0)
+    assert result.loc[0, column_map.anesthesiologist] == "DOE, JANE"
+
+
+def test_normalize_columns_attending_cleanup_matches_scalar_helper():
+    """Vectorized attending cleanup agrees with the scalar extract_attending."""
+    raw_values = [
+        "DOE, JANE@2025-01-01 08:00:00;ROE, RICH@2025-01-01 09:00:00",
+        "  SMITH, ALEX  ",
+        "nan",
+        None,
+        "@2025-01-01 08:00:00",
+    ]
+    csv_df = pd.DataFrame({
+        "MPOG_Case_ID": [f"C{i}" for i in range(len(raw_values))],
+        "AnesAttendings": raw_values,
+    })
+    column_map = ColumnMap()
+
+    result = CsvHandler(column_map).normalize_columns(csv_df)
+
+    assert result[column_map.anesthesiologist].tolist() == [
+        extract_attending(value) for value in raw_values
+    ]
+
+
+def test_csv_handler_read_keeps_pair_order_across_files(tmp_path):
+    """Concurrently read pairs are concatenated in discovery order."""
+    for prefix in ["A", "B", "C"]:
+        pd.DataFrame({
+            "MPOG_Case_ID": [f"{prefix}1", f"{prefix}2"],
+            "AnesAttendings": ["DOE, JANE", "ROE, RICH"],
+        }).to_csv(tmp_path / f"{prefix}.CaseList.csv", index=False)
+        pd.DataFrame({
+            "MPOG_Case_ID": [f"{prefix}1", f"{prefix}9"],
+            "ProcedureName": ["Intubation routine", "Labor Epidural"],
+        }).to_csv(tmp_path / f"{prefix}.ProcedureList.csv", index=False)
+    column_map = ColumnMap()
+
+    result, orphans = CsvHandler(column_map).read(tmp_path)
+
+    assert result[column_map.episode_id].tolist() == [
+        "A1",
+        "A2",
+        "B1",
+        "B2",
+        "C1",
+        "C2",
+    ]
+    assert len(orphans) == 3
+
+
+def test_technique_ranks_match_rank_table_and_default_to_zero():
+    """Vectorized rank lookup agrees with TECHNIQUE_RANK for known and unknown names."""
+    names = [*TECHNIQUE_RANK, "Arterial line", "AAA", "zzz"]
+
+    ranks = _technique_ranks(np.array(names, dtype=object))
+
+    assert ranks.tolist() == [TECHNIQUE_RANK.get(name, 0) for name in names]
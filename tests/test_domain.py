@@ -10,6 +10,7 @@ from case_parser.domain import (
     AirwayManagement,
     AirwayTubeRoute,
     AnesthesiaType,
+    ExtractionFinding,
     ParsedCase,
     ProcedureCategory,
 )
@@ -155,6 +156,54 @@ def test_to_output_dict_with_empty_extractions():
     assert output["Specialized Monitoring Techniques"] == ""
 
 
+def test_to_output_dict_formats_repeated_values_per_case():
+    """Shared dates and technique lists still render each case's own order."""
+    cases = [
+        ParsedCase(
+            raw_date=None,
+            episode_id=str(index),
+            raw_age=None,
+            raw_asa=None,
+            emergent=False,
+            raw_anesthesia_type=None,
+            services=[],
+            procedure=None,
+            procedure_notes=None,
+            responsible_provider=None,
+            case_date=case_date,
+            airway_management=airway,
+        )
+        for index, (case_date, airway) in enumerate([
+            (date(2025, 1, 2), [AirwayManagement.ORAL_ETT]),
+            (
+                date(2025, 1, 2),
+                [AirwayManagement.DIRECT_LARYNGOSCOPE, AirwayManagement.ORAL_ETT],
+            ),
+            (
+                date(2024, 12, 31),
+                [AirwayManagement.ORAL_ETT, AirwayManagement.DIRECT_LARYNGOSCOPE],
+            ),
+        ])
+    ]
+
+    outputs = [case.to_output_dict() for case in cases]
+    cases[0].airway_management.append(AirwayManagement.DIRECT_LARYNGOSCOPE)
+
+    assert [output["Case Date"] for output in outputs] == [
+        "01/02/2025",
+        "01/02/2025",
+        "12/31/2024",
+    ]
+    assert [output["Airway Management"] for output in outputs] == [
+        "Oral ETT",
+        "Direct Laryngoscope; Oral ETT",
+        "Oral ETT; Direct Laryngoscope",
+    ]
+    assert cases[0].to_output_dict()["Airway Management"] == (
+        "Oral ETT; Direct Laryngoscope"
+    )
+
+
 def test_explicit_airway_and_ga_mac_inference_helpers():
     case = ParsedCase(
         raw_date="08/27/2025",
@@ -358,3 +407,40 @@ def test_confidence_score_validation():
             case_date=date(2025, 8, 27),
             confidence_score=-0.1,
         )
+
+
+def test_extraction_finding_rejects_out_of_range_confidence():
+    """Finding confidence keeps the 0-1 bound of the former model."""
+    with pytest.raises(ValueError, match="confidence"):
+        ExtractionFinding(value="Oral ETT", source_field="notes", confidence=1.2)
+
+
+def test_parsed_case_serializes_extraction_findings():
+    """Slotted findings round-trip through ParsedCase JSON dumps."""
+    finding = ExtractionFinding(
+        value="Oral ETT", source_field="notes", confidence=0.5, context="intubated"
+    )
+    case = ParsedCase(
+        raw_date="08/27/2025",
+        episode_id="12345",
+        raw_age=45.0,
+        raw_asa="2",
+        raw_anesthesia_type="general",
+        procedure="Test",
+        procedure_notes="intubated",
+        responsible_provider="Dr. Smith",
+        case_date=date(2025, 8, 27),
+        extraction_findings=[finding],
+    )
+
+    restored = ParsedCase.model_validate_json(case.model_dump_json())
+
+    assert restored.extraction_findings == [finding]
+    assert case.model_dump()["extraction_findings"] == [
+        {
+            "value": "Oral ETT",
+            "source_field": "notes",
+            "confidence": 0.5,
+            "context": "intubated",
+        }
+    ]
@@ -15,13 +15,30 @@ from case_parser.domain import (
 )
 from case_parser.extractors import clean_names, extract_attending
 from case_parser.patterns import (
+    ARTERIAL_LINE_PATTERNS,
+    CENTRAL_LINE_PATTERNS,
+    NEGATION_PATTERNS,
+    PA_CATHETER_PATTERNS,
     extract_airway_management,
+    extract_airway_management_batch,
     extract_monitoring,
+    extract_monitoring_batch,
     extract_vascular_access,
+    extract_vascular_access_batch,
 )
 from case_parser.patterns.extraction_utils import (
+    SATURATED_MATCH_COUNT,
+    FoldedAlternation,
     calculate_pattern_confidence,
+    compile_alternation,
+    compile_patterns,
+    confidence_from_counts,
+    count_matching_patterns,
     extract_with_context,
+    first_match_context,
+    fold_ascii,
+    may_contain_match,
+    required_literals,
 )
 
 
@@ -50,6 +67,18 @@ class TestHelperFunctions:
         assert any("arterial" in match[0].lower() for match in results)
         assert any("central" in match[0].lower() for match in results)
 
+    def test_compile_patterns_matches_string_patterns(self):
+        """Precompiled patterns behave like their string sources."""
+        text = "INTUBATION performed with ETT"
+        patterns = [r"\bintubation\b", r"\bETT\b"]
+
+        compiled = compile_patterns(patterns)
+
+        assert all(isinstance(pattern, re.Pattern) for pattern in compiled)
+        assert extract_with_context(text, compiled) == extract_with_context(
+            text, patterns
+        )
+
     def test_extract_with_context_case_insensitive(self):
         """Test case-insensitive matching."""
         text = "INTUBATION performed with ETT"
@@ -308,6 +337,58 @@ class TestAirwayManagementExtraction:
             assert finding.context is not None
             assert len(finding.context) > 0
 
+    def test_negation_cue_lowers_finding_confidence(self):
+        """Negation words reduce confidence; words merely containing them do not."""
+        _airway, plain = extract_airway_management("LMA placed, nodes noted")
+        _airway, negated = extract_airway_management("LMA placed without difficulty")
+
+        assert plain[0].confidence == pytest.approx(0.5)
+        assert negated[0].confidence == pytest.approx(0.2)
+
+    def test_every_technique_is_reported_once(self):
+        """A note hitting every category lists each technique exactly once."""
+        techniques, findings = extract_airway_management(
+            "Nasal intubation with DLT via glidescope; fiberoptic bronchoscope, "
+            "LMA backup, mask ventilation, difficult airway"
+        )
+
+        assert len(techniques) == len(set(techniques)) == len(findings)
+        assert techniques[0] == AirwayManagement.NASAL_ETT
+
+    def test_sentinel_keeps_double_lumen_only_notes(self):
+        """Notes naming only a DLT must still pass the airway pre-filter."""
+        techniques, findings = extract_airway_management("Placed 37 Fr DLT")
+
+        assert techniques == [
+            AirwayManagement.ORAL_ETT,
+            AirwayManagement.DOUBLE_LUMEN_ETT,
+        ]
+        assert len(findings) == 2
+
+    def test_batch_matches_per_note_extraction(self):
+        """Column-wise extraction returns the per-note result for every row."""
+        notes = pd.Series(
+            [
+                "Nasal intubation with glidescope, DLT placed",
+                "LMA placed after mask ventilation",
+                "Regional block only",
+                "Nasal cannula at 2 L",
+                None,
+                float("nan"),
+                "Difficult airway, multiple attempts, FOI",
+            ],
+            index=[10, 11, 12, 13, 14, 15, 16],
+            dtype=object,
+        )
+
+        result = extract_airway_management_batch(notes)
+
+        assert list(result.index) == list(notes.index)
+        for note, techniques, findings in zip(
+            notes, result["airway_management"], result["findings"], strict=True
+        ):
+            assert (techniques, findings) == extract_airway_management(note)
+
 
 class TestVascularAccessExtraction:
     """Test vascular access extraction."""
@@ -418,6 +499,59 @@ class TestVascularAccessExtraction:
             assert finding.source_field == "test_field"
             assert 0.0 <= finding.confidence <= 1.0
 
+    def test_confidence_counts_negation_and_central_line_support(self):
+        """Negation lowers line findings; central-line hits support the PAC."""
+        notes = "CVC in internal jugular, PA catheter floated, no arterial line"
+        _vascular, findings = extract_vascular_access(notes)
+        confidence = {finding.value: finding.confidence for finding in findings}
+
+        for value, patterns, supporting, negation in (
+            (
+                VascularAccess.ARTERIAL_CATHETER.value,
+                ARTERIAL_LINE_PATTERNS,
+                None,
+                NEGATION_PATTERNS,
+            ),
+            (
+                VascularAccess.CENTRAL_VENOUS_CATHETER.value,
+                CENTRAL_LINE_PATTERNS,
+                None,
+                NEGATION_PATTERNS,
+            ),
+            (
+                VascularAccess.PULMONARY_ARTERY_CATHETER.value,
+                PA_CATHETER_PATTERNS,
+                CENTRAL_LINE_PATTERNS,
+                None,
+            ),
+        ):
+            assert confidence[value] == pytest.approx(
+                calculate_pattern_confidence(notes, patterns, supporting, negation)
+            )
+
+    def test_batch_matches_per_note_extraction(self):
+        """Column-wise extraction returns the per-note result for every row."""
+        notes = pd.Series(
+            [
+                "Right radial A-line, CVC via internal jugular, Swan-Ganz floated",
+                "No arterial line placed",
+                "PAC through existing central line",
+                "Regional block only",
+                None,
+                float("nan"),
+            ],
+            index=[3, 4, 5, 6, 7, 8],
+            dtype=object,
+        )
+
+        result = extract_vascular_access_batch(notes)
+
+        assert list(result.index) == list(notes.index)
+        for note, access, findings in zip(
+            notes, result["vascular_access"], result["findings"], strict=True
+        ):
+            assert (access, findings) == extract_vascular_access(note)
+
 
 class TestMonitoringExtraction:
     """Test monitoring technique extraction."""
@@ -546,6 +680,40 @@ class TestMonitoringExtraction:
             assert finding.source_field == "test_field"
             assert 0.0 <= finding.confidence <= 1.0
 
+    def test_repeated_notes_return_independent_lists(self):
+        """Cached results are copied so callers can mutate what they receive."""
+        notes = "TEE performed, neuromonitoring with SSEPs"
+        monitoring, findings = extract_monitoring(notes)
+        expected = (list(monitoring), list(findings))
+        monitoring.clear()
+        findings.clear()
+
+        assert expected[0]
+        assert extract_monitoring(notes) == expected
+
+    def test_batch_matches_per_note_extraction(self):
+        """Column-wise extraction returns the per-note result for every row."""
+        notes = pd.Series(
+            [
+                "TEE performed, neuromonitoring with SSEPs",
+                "Lumbar drain placed, ICP monitor in situ",
+                "Routine GA",
+                None,
+                float("nan"),
+            ],
+            dtype=object,
+        )
+
+        result = extract_monitoring_batch(notes, source_field="procedure")
+
+        assert list(result.index) == list(notes.index)
+        for note, monitoring, findings in zip(
+            notes, result["monitoring"], result["findings"], strict=True
+        ):
+            assert (monitoring, findings) == extract_monitoring(
+                note, source_field="procedure"
+            )
+
 
 class TestConfidenceScoring:
     """Test confidence scoring in extractions."""
@@ -585,3 +753,110 @@ class TestConfidenceScoring:
         # Should have base confidence without much supporting evidence
         assert len(ett_findings) > 0
         assert 0.3 <= ett_findings[0].confidence <= 0.7
+
+    def test_confidence_from_counts_matches_pattern_scoring(self):
+        """Count-based scoring equals full scoring once the primary matched."""
+        text = "No ETT; intubated with DL, not difficult, without issue"
+        supporting = [r"\bETT\b", r"\bintubat", r"\bDL\b", r"\bVL\b"]
+        negation = [r"\bno\s+", r"\bnot\s+", r"\bwithout\s+", r"\bdenied\b"]
+
+        assert confidence_from_counts(3, 3) == calculate_pattern_confidence(
+            text, [r"\bDL\b"], supporting, negation
+        )
+        assert confidence_from_counts(3, 0) == calculate_pattern_confidence(
+            text, [r"\bDL\b"], supporting
+        )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "DL with Miller blade, then intubated",
+        "Mask ventilation, LMA placed",
+        "no airway documented",
+        "",
+    ],
+)
+def test_fused_patterns_match_per_pattern_helpers(text):
+    """Fused alternation and first-match context agree with per-pattern scans."""
+    patterns = [r"\bintubat(ed|ion|e)?\b", r"\bDL\b", r"\bmask\b", r"\bLMA\b"]
+    matches = extract_with_context(text, patterns)
+
+    assert bool(compile_alternation(patterns).search(text)) == bool(matches)
+    assert first_match_context(text, patterns) == (matches[0][1] if matches else None)
+
+
+def test_count_matching_patterns_caps_at_confidence_saturation():
+    """Capped counts stop early without changing the confidence score."""
+    patterns = [r"\bno\b", r"\bnot\b", r"\bwithout\b", r"\bdeclined\b", r"\bnever\b"]
+    text = "no ETT, not intubated, without LMA, declined mask, never DL"
+
+    assert count_matching_patterns(text, patterns) == 5
+    assert count_matching_patterns(text, patterns, SATURATED_MATCH_COUNT) == 4
+    assert count_matching_patterns("ETT", patterns, SATURATED_MATCH_COUNT) == 0
+    for supporting in range(8):
+        assert confidence_from_counts(
+            min(supporting, SATURATED_MATCH_COUNT), SATURATED_MATCH_COUNT
+        ) == confidence_from_counts(supporting, 5)
+
+
+def test_required_literals_gate_only_impossible_matches():
+    """Literal pre-filter rejects texts lacking every required literal."""
+    literals = required_literals([
+        r"\bCSF\s+(drain(age)?|catheter)\b",
+        r"\blumbar\s+drain\b",
+        r"\bcerebrospinal\s+fluid\s+drain",
+        r"\bspinal\s+drain\b",
+    ])
+
+    assert literals == ("csf", "lumbar", "spinal")
+    assert required_literals([r"\b(tube|ett)\s+placed\b"]) == ("placed",)
+    assert required_literals([r"(a|b)+"]) is None
+    assert not may_contain_match(fold_ascii("Routine GA, no lines"), literals)
+    assert may_contain_match(fold_ascii("LUMBAR DRAIN placed"), literals)
+    # Non-ASCII text always falls through to the regex search.
+    assert fold_ascii("Routine GA \u017f") is None
+    assert may_contain_match(None, literals)
+
+
+def test_required_literals_disable_prefilter_when_parser_layout_changes(
+    monkeypatch,
+):
+    """An unexpected re._parser layout drops the prefilter instead of raising."""
+    monkeypatch.setattr("re._parser.parse", lambda _pattern: [("LITERAL",)])
+
+    literals = required_literals([r"\blumbar\s+drain\b"])
+
+    assert literals is None
+    assert may_contain_match(fold_ascii("Routine GA, no lines"), literals)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Patient INTUBATED, ETT 7.0",
+        "s/p DLT, no LMA",
+        "Fiberoptic bronchoscope then intubated",
+        "mask only",
+        "DLT exchanged for a single-lumen tube once the patient was intubated",
+        "Pa\u017fient intubated with MAC \u017fSEP",
+    ],
+)
+def test_folded_alternation_matches_ignore_case_search(text):
+    """The folded fast path agrees with re.IGNORECASE on ASCII and non-ASCII."""
+    patterns = [
+        r"\bintubat(ed|ion|e)?\b",
+        r"\bDLT\b",
+        r"\bmask\b(?!.*\bLMA\b)",
+        r"\bSSEP\b",
+    ]
+    alternation = FoldedAlternation.compile(patterns)
+
+    assert alternation.search(text, fold_ascii(text)) == (
+        compile_alternation(patterns).search(text) is not None
+    )
+    # Context comes from the first listed pattern that matches, even when a
+    # later pattern matches further left.
+    assert alternation.first_match_context(
+        text, fold_ascii(text), context_window=5
+    ) == first_match_context(text, patterns, context_window=5)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import math
+import pickle  # noqa: S403
 from datetime import UTC, date, datetime
 from unittest.mock import patch
 
@@ -14,6 +16,7 @@ from case_parser.domain import (
     AgeCategory,
     AirwayManagement,
     AnesthesiaType,
+    MonitoringTechnique,
     ParsedCase,
     ProcedureCategory,
 )
@@ -38,6 +41,14 @@ def default_column_map():
     )
 
 
+def test_column_map_round_trips_through_pickle(default_column_map):
+    """Slotted ColumnMap must survive pickling into process-pool workers."""
+    restored = pickle.loads(pickle.dumps(default_column_map))  # noqa: S301
+
+    assert restored == default_column_map
+    assert not hasattr(restored, "__dict__")
+
+
 @pytest.fixture
 def processor(default_column_map):
     """Provide a processor instance for tests."""
@@ -103,6 +114,20 @@ class TestDateParsing:
             UTC,
         ]
 
+    def test_prepare_dates_converts_offsets_to_utc(self, processor):
+        """Offset-aware date columns convert to UTC for every row."""
+        prepared_dates = processor._prepare_dates([
+            "2024-01-05T10:00+02:00",
+            None,
+            "2024-01-06T10:00+02:00",
+        ])
+
+        assert [timestamp for timestamp, _warnings in prepared_dates] == [
+            datetime(2024, 1, 5, 8, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2024, 1, 6, 8, tzinfo=UTC),
+        ]
+
 
 class TestAgeCategorization:
     """Test age categorization functionality."""
@@ -165,6 +190,14 @@ class TestAgeCategorization:
         assert len(warnings) == 1
         assert "outside expected range" in warnings[0]
 
+    def test_prepare_ages_matches_per_value_categorization(self, processor):
+        """Batched age preparation should mirror determine_age_category."""
+        values = [None, math.nan, "not-a-number", "45", 0.25, 3, 12.0, 65, 150.0, -1]
+
+        prepared = processor._prepare_ages(values)
+
+        assert prepared == [processor.determine_age_category(v) for v in values]
+
 
 class TestAnesthesiaTypeMapping:
     """Test anesthesia type mapping functionality."""
@@ -231,6 +264,20 @@ class TestAnesthesiaTypeMapping:
         assert anesthesia_type == AnesthesiaType.CSE
         assert len(warnings) == 0
 
+    def test_map_exact_keyword_matches_first_substring_hit(self, processor):
+        """Exact keyword shortcut should agree with the ordered substring scan."""
+        keyword_types = processor_module._ANESTHESIA_KEYWORD_TYPES
+        for keyword in keyword_types:
+            expected = next(
+                mapped
+                for candidate, (_category, mapped) in keyword_types.items()
+                if candidate in keyword
+            )
+            anesthesia_type, _warnings = processor.map_anesthesia_type(
+                f" {keyword.lower()} "
+            )
+            assert anesthesia_type == expected, keyword
+
     def test_map_peripheral_nerve_block_not_mapped_from_anesthesia_field(
         self, processor
     ):
@@ -403,6 +450,17 @@ class TestEmergentFlag:
             result = processor.normalize_emergent_flag(value)
             assert result is False, f"Failed for: {value}"
 
+    def test_parse_asa_fields_keeps_lowercase_e_suffix(self, processor):
+        """Test an existing lowercase ASA E suffix is not duplicated."""
+        asa_str, emergent, _raw_asa, warnings = processor._parse_asa_fields({
+            "ASA": "3e",
+            "Emergent": "Y",
+        })
+
+        assert asa_str == "3e"
+        assert emergent is True
+        assert warnings == []
+
 
 class TestStandaloneBlockDebug:
     """Test helpers used by standalone orphan debugging output."""
@@ -972,6 +1030,50 @@ class TestDataFrameProcessing:
         assert cases[0].episode_id == "12345"
         assert cases[1].episode_id == "12346"
 
+    def test_process_dataframe_passes_only_mapped_columns(self, processor):
+        """Unmapped source columns stay out of the per-row dicts."""
+        df = pd.DataFrame([
+            {
+                "Date": "08/27/2025",
+                "Episode ID": "12345",
+                "Procedure": "Surgery A",
+                "Procedure Notes": "Intubated",
+                "Room": "OR 7",
+                "Surgeon": "Dr. Who",
+            },
+        ])
+
+        with patch.object(
+            processor, "process_row", wraps=processor.process_row
+        ) as process_row:
+            cases = processor.process_dataframe(df)
+
+        row = process_row.call_args.args[0]
+        assert set(row) == {"Date", "Episode ID", "Procedure", "Procedure Notes"}
+        assert cases[0].episode_id == "12345"
+        assert cases[0].procedure == "Surgery A"
+
+    def test_process_dataframe_matches_process_row_for_missing_cells(self, processor):
+        """Missing cells swept to None parse like the raw NaN/NaT row values."""
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(["08/27/2025", None], format="%m/%d/%Y"),
+            "Episode ID": ["12345", None],
+            "Age": [45.0, math.nan],
+            "ASA": [2.0, math.nan],
+            "Emergent": [None, "Y"],
+            "Procedure": ["Surgery A", None],
+            "Services": [math.nan, "ORTHO"],
+            "Procedure Notes": [None, "Intubated"],
+        })
+
+        cases = processor.process_dataframe(df)
+
+        assert [case.model_dump() for case in cases] == [
+            processor.process_row(row).model_dump() for _, row in df.iterrows()
+        ]
+        assert cases[1].raw_date is None
+        assert cases[1].asa_physical_status == "E"
+
     def test_process_dataframe_with_errors(self, processor, default_column_map):
         """Test processing dataframe with error rows."""
         df = pd.DataFrame([
@@ -1221,3 +1323,71 @@ class TestProcessDataframeExtended:
         df = processor.cases_to_dataframe(cases)
 
         assert list(df.columns) == OUTPUT_COLUMNS
+
+
+def test_process_row_merges_procedure_monitoring_after_notes(processor):
+    """Procedure-text monitoring is appended once, after note findings."""
+    row = pd.Series({
+        "Date": "08/27/2025",
+        "Episode ID": "12345",
+        "Procedure": "Craniotomy with SSEP neuromonitoring and TEE",
+        "Procedure Notes": "SSEP baseline obtained",
+    })
+
+    case = processor.process_row(row)
+
+    assert case.monitoring == [
+        MonitoringTechnique.ELECTROPHYSIOLOGIC_MON,
+        MonitoringTechnique.TEE,
+    ]
+
+
+def test_should_use_process_pool_for_large_rule_only_batches(processor, monkeypatch):
+    """Rule-only processors also chunk large batches across processes."""
+    monkeypatch.setattr(processor_module, "_PROCESS_POOL_MIN_ROWS", 10)
+
+    assert processor.classifier.ml_predictor is None
+    assert processor._should_use_process_pool(10, workers=2) is (
+        processor_module._get_process_pool_context() is not None
+    )
+    assert not processor._should_use_process_pool(10, workers=1)
+    assert not processor._should_use_process_pool(9, workers=2)
+
+
+@pytest.mark.skipif(
+    processor_module._get_process_pool_context() is None,
+    reason="fork-based process pools are not available",
+)
+def test_process_chunks_match_in_process_dates(processor, monkeypatch):
+    """Chunks reuse whole-frame date parsing instead of re-inferring formats."""
+    monkeypatch.setattr(processor_module, "_PROCESS_POOL_TARGET_CHUNK_ROWS", 2)
+    df = pd.DataFrame([
+        {**_FULL_ROW, "Episode ID": str(index), "Date": value}
+        for index, value in enumerate([
+            "08/27/2025",
+            "08/28/2025",
+            "2025-08-29",
+            "08/30/2025",
+            None,
+        ])
+    ])
+
+    chunked = processor._process_rows_in_process_chunks(df, workers=2)
+    in_process = processor.process_dataframe(df)
+
+    assert [case.model_dump() for case in chunked] == [
+        case.model_dump() for case in in_process
+    ]
+
+
+def test_process_dataframe_keeps_last_duplicate_column_value(processor):
+    """Duplicate labels resolve like to_dict(orient="records"): last one wins."""
+    df = pd.DataFrame(
+        [["stale", "CABG", "fresh"]],
+        columns=["Episode ID", "Procedure", "Episode ID"],
+    )
+
+    cases = processor.process_dataframe(df)
+
+    assert cases[0].episode_id == "fresh"
+    assert cases[0].procedure == "CABG"
@@ -54,6 +54,30 @@ class TestReadExcel:
         assert list(result.columns) == ["X"]
         assert len(result) == 2
 
+    def test_skiprows_and_nrows_count_data_rows(self, tmp_path):
+        path = tmp_path / "test.xlsx"
+        pd.DataFrame({"A": [1, 2, 3, 4]}).to_excel(path, index=False)
+
+        result = read_excel(path, nrows=2, skiprows=1)
+
+        assert list(result.columns) == ["A"]
+        assert result["A"].tolist() == [2, 3]
+
+    def test_forwards_read_only_engine_kwargs(self, tmp_path):
+        path = tmp_path / "test.xlsx"
+        pd.DataFrame({"A": [1]}).to_excel(path, index=False)
+
+        with patch(
+            "case_parser.io.pd.read_excel", return_value=pd.DataFrame()
+        ) as mock_read:
+            read_excel(path, read_only=False)
+
+        assert mock_read.call_args.kwargs["engine"] == "openpyxl"
+        assert mock_read.call_args.kwargs["engine_kwargs"] == {
+            "read_only": False,
+            "data_only": True,
+        }
+
 
 class TestExcelHandlerWriteExcel:
     def test_writes_file_to_disk(self, tmp_path):
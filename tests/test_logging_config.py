@@ -0,0 +1,42 @@
+"""Tests for application logging setup."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from case_parser.logging_config import setup_logging
+
+
+@pytest.fixture
+def restore_root_logger():
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    level = root_logger.level
+    yield root_logger
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+def test_setup_logging_is_idempotent_for_same_settings(restore_root_logger):
+    setup_logging("INFO")
+    handler = restore_root_logger.handlers[0]
+
+    setup_logging("info")
+
+    assert restore_root_logger.handlers == [handler]
+    assert restore_root_logger.level == logging.INFO
+
+
+def test_setup_logging_reconfigures_on_change(restore_root_logger):
+    setup_logging("INFO")
+    handler = restore_root_logger.handlers[0]
+
+    setup_logging("INFO", verbose=True)
+    assert restore_root_logger.handlers != [handler]
+    assert restore_root_logger.level == logging.DEBUG
+
+    restore_root_logger.handlers.clear()
+    setup_logging("INFO", verbose=True)
+    assert len(restore_root_logger.handlers) == 1
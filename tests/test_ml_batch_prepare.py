@@ -54,3 +54,22 @@ def test_process_single_file_uses_exported_service_text_for_rule_categorization(
     assert result["cases"][0]["rule_category"] == (
         ProcedureCategory.CARDIAC_WITH_CPB.value
     )
+
+
+def test_process_single_file_defaults_missing_optional_columns(tmp_path):
+    csv_path = tmp_path / "cases.csv"
+    pd.DataFrame({
+        "AIMS_Actual_Procedure_Text": ["CABG", None],
+        "ASA_Status": [3, 2],
+    }).to_csv(csv_path, index=False)
+
+    result = batch_prepare.process_single_file(csv_path)
+
+    assert result["total_rows"] == 2
+    assert result["valid_cases"] == 1
+    case = result["cases"][0]
+    assert case["procedure"] == "CABG"
+    assert case["service_text"] == ""
+    assert case["asa"] == 3
+    assert case["age"] is None
+    assert case["emergency"] is None
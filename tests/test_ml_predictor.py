@@ -8,8 +8,16 @@ from collections import UserDict
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from case_parser.ml.config import BASE_DEFAULT_ML_INFERENCE_JOBS
-from case_parser.ml.predictor import MLPredictor, ProcedureMLPipeline
+from case_parser.ml.predictor import (
+    MLPredictor,
+    ProcedureMLPipeline,
+    model_checksum_path,
+    write_model_checksum,
+)
 
 
 @dataclass
@@ -95,8 +103,79 @@ def test_load_validates_invalid_explicit_inference_jobs(tmp_path):
     assert "inference_jobs" in str(caught[0].message)
 
 
+def test_load_verifies_checksum_sidecar(tmp_path):
+    model_path = tmp_path / "model.pkl"
+    _write_model(model_path)
+    checksum_path = write_model_checksum(model_path)
+
+    assert checksum_path == model_checksum_path(model_path)
+    assert MLPredictor.load(model_path, inference_jobs=1).pipeline.model.n_jobs == 1
+
+    checksum_path.write_text("0" * 64 + "  model.pkl\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        MLPredictor.load(model_path, inference_jobs=1)
+
+
 def test_coerce_inputs_treats_mapping_as_single_item():
     pipeline = ProcedureMLPipeline(_EchoModel(), _EchoFeatures())
     raw_input = UserDict({"procedure": "CABG"})
 
     assert pipeline.predict(raw_input) == [raw_input]
+
+
+@dataclass
+class _CountingProbaPipeline:
+    classes_: list[str] = field(default_factory=lambda: ["A", "B"])
+    seen: list[list[str]] = field(default_factory=list)
+
+    def predict_proba(self, inputs):
+        texts = [item.procedure_text for item in inputs]
+        self.seen.append(texts)
+        return np.array([
+            [0.25, 0.75] if text.startswith("B") else [0.9, 0.1] for text in texts
+        ])
+
+
+def test_predict_proba_many_runs_each_unseen_input_once():
+    pipeline = _CountingProbaPipeline()
+    predictor = MLPredictor(pipeline=pipeline, metadata={}, inference_jobs=1)
+
+    first = predictor.predict_proba_many(["CABG", "B case", "CABG"])
+    second = predictor.predict_proba_many(["B case", "Knee"])
+
+    assert pipeline.seen == [["CABG", "B case"], ["Knee"]]
+    np.testing.assert_allclose(first, [[0.9, 0.1], [0.25, 0.75], [0.9, 0.1]])
+    np.testing.assert_allclose(second, [[0.25, 0.75], [0.9, 0.1]])
+    assert predictor.get_confidence("CABG") == pytest.approx(0.9)
+    assert pipeline.seen == [["CABG", "B case"], ["Knee"]]
+
+
+@dataclass
+class _LengthModel:
+    classes_: list[str] = field(default_factory=lambda: ["short", "long"])
+
+    def predict(self, inputs):
+        return ["long" if len(item) > 4 else "short" for item in inputs]
+
+    def predict_proba(self, inputs):
+        return [[0.0, 1.0] if len(item) > 4 else [1.0, 0.0] for item in inputs]
+
+
+@dataclass
+class _CountingFeatures:
+    calls: int = 0
+
+    def transform(self, inputs):
+        self.calls += 1
+        return inputs
+
+
+def test_predict_with_proba_transforms_features_once():
+    features = _CountingFeatures()
+    pipeline = ProcedureMLPipeline(_LengthModel(), features)
+
+    labels, probabilities = pipeline.predict_with_proba(["CABG", "Craniotomy"])
+
+    assert features.calls == 1
+    assert labels == pipeline.predict(["CABG", "Craniotomy"])
+    assert probabilities == pipeline.predict_proba(["CABG", "Craniotomy"])
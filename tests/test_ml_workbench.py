@@ -441,3 +441,33 @@ def test_review_command_does_not_retrain_when_user_quits(monkeypatch):
 
     assert rc == 0
     assert any("Review ended early" in message for message in printed)
+
+
+def test_review_progress_round_trips_through_saved_json(tmp_path):
+    progress_path = tmp_path / "review" / "progress.json"
+    runtime = workbench.ReviewRuntime(
+        paths=workbench.ReviewPaths(
+            model_path=tmp_path / "model.pkl",
+            data_path=tmp_path / "data.csv",
+            output_path=tmp_path / "review_labels.csv",
+            progress_path=progress_path,
+        ),
+        config=workbench.ReviewConfig(
+            focus="priority",
+            low_confidence=0.8,
+            max_cases=10,
+            ui_mode="tui",
+            resume=True,
+            retrain_on_complete=False,
+        ),
+        reviewed_indices={7, 2, 11},
+    )
+
+    workbench._save_review_progress(runtime)
+
+    assert workbench._load_review_progress(progress_path) == {
+        "data_path": str(tmp_path / "data.csv"),
+        "model_path": str(tmp_path / "model.pkl"),
+        "reviewed_indices": [2, 7, 11],
+    }
+    assert workbench._load_reviewed_indices(runtime.paths, resume=True) == {2, 7, 11}
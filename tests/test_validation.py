@@ -6,8 +6,10 @@ import json
 from datetime import date
 from typing import Any
 
+import pandas as pd
 import pytest
 
+import case_parser.validation as validation_module
 from case_parser.domain import (
     AgeCategory,
     AirwayManagement,
@@ -151,6 +153,15 @@ class TestGetProblematicCases:
         # C001: high confidence, no warnings → not problematic
         assert "C001" not in ids
 
+    def test_repeated_calls_return_fresh_lists_per_threshold(self, sample_cases):
+        report = ValidationReport(sample_cases)
+        first = report.get_problematic_cases()
+        first.clear()
+
+        assert report.get_problematic_cases() == report.get_problematic_cases()
+        assert len(report.get_problematic_cases()) == 3
+        assert len(report.get_problematic_cases(min_warnings=2)) == 2
+
     def test_empty_input(self):
         report = ValidationReport([])
         assert report.get_problematic_cases() == []
@@ -206,6 +217,32 @@ class TestGetExtractionStatistics:
         expected_airway_rate = round(stats["cases_with_airway_extraction"] / total, 3)
         assert stats["extraction_rate"]["airway"] == expected_airway_rate
 
+    def test_type_histograms_keyed_by_value_in_first_seen_order(self):
+        cases = [
+            _make_case(
+                airway=[AirwayManagement.ORAL_ETT],
+                monitoring=[MonitoringTechnique.TEE],
+            ),
+            _make_case(
+                airway=[AirwayManagement.DOUBLE_LUMEN_ETT, AirwayManagement.ORAL_ETT]
+            ),
+            _make_case(),
+        ]
+        stats = ValidationReport(cases)._get_extraction_statistics()
+
+        assert list(stats["airway_types"].items()) == [
+            (AirwayManagement.ORAL_ETT.value, 2),
+            (AirwayManagement.DOUBLE_LUMEN_ETT.value, 1),
+        ]
+        assert stats["vascular_types"] == {}
+        assert stats["monitoring_types"] == {MonitoringTechnique.TEE.value: 1}
+        assert stats["cases_with_airway_extraction"] == 2
+        assert stats["extraction_rate"] == {
+            "airway": round(2 / 3, 3),
+            "vascular": 0,
+            "monitoring": round(1 / 3, 3),
+        }
+
 
 class TestToDataframe:
     def test_returns_dataframe_with_expected_columns(self, sample_cases):
@@ -258,8 +295,25 @@ class TestSaveReport:
         report.save_report(path, "json")
 
         assert path.exists()
-        parsed = json.loads(path.read_text())
+        parsed = json.loads(path.read_text(encoding="utf-8"))
         assert "summary" in parsed
+        assert parsed == report.generate_json_report()
+
+    @pytest.mark.parametrize("batch_size", [1, 500])
+    @pytest.mark.parametrize("case_count", [0, None])
+    def test_streamed_json_matches_indented_dump(
+        self, tmp_path, sample_cases, case_count, batch_size, monkeypatch
+    ):
+        monkeypatch.setattr(validation_module, "_JSON_STREAM_BATCH_SIZE", batch_size)
+        report = ValidationReport(sample_cases[:case_count])
+        assert case_count == 0 or len(report.get_problematic_cases()) > 1
+        path = tmp_path / "report.json"
+
+        report.save_report(path, "json")
+
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            report.generate_json_report(), indent=2
+        )
 
     def test_saves_excel_report(self, tmp_path, sample_cases):
         report = ValidationReport(sample_cases)
@@ -268,6 +322,12 @@ class TestSaveReport:
         report.save_report(path, "excel")
 
         assert path.exists()
+        written = pd.read_excel(
+            path, sheet_name="Validation", dtype=str, keep_default_na=False
+        )
+        pd.testing.assert_frame_equal(
+            written, report.to_dataframe().astype(str), check_dtype=False
+        )
 
     def test_raises_for_invalid_format(self, tmp_path, sample_cases):
         report = ValidationReport(sample_cases)